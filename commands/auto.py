@@ -2,6 +2,7 @@
 from wpimath.kinematics import ChassisSpeeds
 from commands2 import Command, cmd
 from wpilib import SendableChooser, SmartDashboard
+from lib.coroutine_command import CoroutineCommand, repeat
 
 if TYPE_CHECKING:
     from robotcontainer import RobotContainer
@@ -33,12 +34,18 @@ class Auto:
         self._selectedAuto = autoCmd
 
     def auto_center(self) -> Command:
-        # Move forward at 25% speed for 3.25s, then stop
+        # Move forward at 25% speed for 3.25s, stop, then eject for 0.5s
         drive = self._robot._drive
         roller = self._robot._roller
         speeds = ChassisSpeeds(vx=0.25)
-        return cmd.sequence(
-            drive.driveCommand(speeds).withTimeout(3.25),
-            drive.stopCommand().withTimeout(0.1),
-            roller.ejectCommand().withTimeout(0.5)
-        )
+        stopped = ChassisSpeeds()
+
+        async def center():
+            await repeat(lambda: drive.setChassisSpeed(speeds), 3.25)
+            await repeat(lambda: drive.setChassisSpeed(stopped), 0.1)
+            try:
+                await repeat(roller.eject, 0.5)
+            finally:
+                roller.stop()
+
+        return CoroutineCommand(center, drive, roller)
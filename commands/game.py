@@ -1,12 +1,16 @@
 ﻿import math
-from typing import TYPE_CHECKING, Callable
+import weakref
+from typing import TYPE_CHECKING, Callable, Tuple
 from commands2 import Command
 from wpimath.controller import HolonomicDriveController, PIDController, ProfiledPIDControllerRadians
 from wpimath.geometry import Pose2d
 from wpimath.trajectory import Trajectory, TrapezoidProfileRadians
 from lib.differential_module import DifferentialControllerCommand
+from lib.tunables import Tunable, Tunables
 import constants
 
+DriveConstants = constants.Subsystems.Drive
+
 if TYPE_CHECKING:
     from robotcontainer import RobotContainer
 
@@ -15,7 +19,31 @@ class Game:
     def __init__(self, robot: "RobotContainer"):
         self._robot = robot
 
+        tunables = Tunables.getInstance()
+        self._translationPID = self._addPIDTunables(tunables, 'Drive/TranslationPID', DriveConstants.TranslationPID)
+        self._rotationPID = self._addPIDTunables(tunables, 'Drive/RotationPID', DriveConstants.RotationPID)
+        self._maxVelocity = tunables.add('Drive/MaxVelocity', DriveConstants.MaxVelocity)
+        self._maxAcceleration = tunables.add('Drive/MaxAcceleration', DriveConstants.MaxAcceleration)
+        # Trajectory commands that have been created get new controllers when the gains are tuned
+        self._trajectoryCommands: "weakref.WeakSet[DifferentialControllerCommand]" = weakref.WeakSet()
+        for tunable in (*self._translationPID, *self._rotationPID, self._maxVelocity, self._maxAcceleration):
+            tunable.subscribe(self._onDriveTuned)
+
+    @staticmethod
+    def _addPIDTunables(tunables: Tunables, key: str, pid: constants.PID) -> Tuple[Tunable, Tunable, Tunable]:
+        return (
+            tunables.add(f'{key}/P', pid.P),
+            tunables.add(f'{key}/I', pid.I),
+            tunables.add(f'{key}/D', pid.D)
+        )
+
+    def _onDriveTuned(self, _: float) -> None:
+        for command in self._trajectoryCommands:
+            command.setController(self._createDriveController())
+
     # TODO: Add any composite commands (anything that involves multiple steps or multiple subsystems) here
+    # Long sequences can also be written as a single `async def` using CoroutineCommand
+    # from lib/coroutine_command.py (see Auto.auto_center).
     # This is an example from The Lady Cans (FRC 2881):
     # def intakeCoralFromGround(self) -> Command:
     #   return (
@@ -37,39 +65,45 @@ class Game:
             get_pose: Callable[[], Pose2d],
             trajectory: Trajectory) -> Command:
         """Returns a command that drives the robot along the provided trajectory"""
-        DriveConstants = constants.Subsystems.Drive
         driveSubsystem = self._robot._drive
-        
+        command = DifferentialControllerCommand(
+            trajectory=trajectory,
+            pose=get_pose,
+            kinematics=DriveConstants.Kinematics,
+            controller=self._createDriveController(),
+            outputModuleStates=driveSubsystem.setWheelSpeeds,
+            requirements=(driveSubsystem,)
+        )
+        self._trajectoryCommands.add(command)
+        return command
+
+    def _createDriveController(self) -> HolonomicDriveController:
+        """Creates the trajectory following controller from the current tunable gains"""
+        translationP, translationI, translationD = (tunable.value for tunable in self._translationPID)
+        rotationP, rotationI, rotationD = (tunable.value for tunable in self._rotationPID)
+
         x_controller = PIDController(
-            P=DriveConstants.TranslationPID.P,
-            I=DriveConstants.TranslationPID.I,
-            D=DriveConstants.TranslationPID.D)
+            Kp=translationP,
+            Ki=translationI,
+            Kd=translationD)
         y_controller = PIDController(
-            P=DriveConstants.TranslationPID.P,
-            I=DriveConstants.TranslationPID.I,
-            D=DriveConstants.TranslationPID.D)
+            Kp=translationP,
+            Ki=translationI,
+            Kd=translationD)
         theta_controller = ProfiledPIDControllerRadians(
-            Kp=DriveConstants.RotationPID.P,
-            Ki=DriveConstants.RotationPID.I,
-            Kd=DriveConstants.RotationPID.D,
+            Kp=rotationP,
+            Ki=rotationI,
+            Kd=rotationD,
             constraints=TrapezoidProfileRadians.Constraints(
-                maxVelocity=DriveConstants.MaxVelocity,
-                maxAcceleration=DriveConstants.MaxAcceleration
+                maxVelocity=self._maxVelocity.value,
+                maxAcceleration=self._maxAcceleration.value
             )
         )
         # Allow the controller to wrap around. -180 degrees and 180 degrees (-math.pi and math.pi radians)
         # are the same.
         theta_controller.enableContinuousInput(-math.pi, math.pi)
-        drive_controller = HolonomicDriveController(
+        return HolonomicDriveController(
             xController=x_controller,
             yController=y_controller,
             thetaController=theta_controller
         )
-        return DifferentialControllerCommand(
-            trajectory=trajectory,
-            pose=get_pose,
-            kinematics=DriveConstants.Kinematics,
-            controller=drive_controller,
-            outputModuleStates=driveSubsystem.setWheelSpeeds,
-            requirements=(driveSubsystem)
-        )
@@ -9,6 +9,54 @@ class Controllers:
     DriverPort = 0
     OperatorPort = 1
 
+    class DriveInput:
+        Deadband = 0.1
+        # Curve applied to each axis after the deadband (forward, strafe, rotation). 1.0 is linear,
+        # higher values give finer control near the center of the stick
+        Exponents = (2.0, 2.0, 3.0)
+        DefaultSpeedMode = SpeedMode.Competition
+        # Max output (-1.0 to 1.0) and max change in output per second for each axis
+        SpeedModes = {
+            SpeedMode.Competition: DriveInputConstants(
+                maxOutput=(1.0, 1.0, 1.0),
+                rateLimit=(4.0, 4.0, 6.0)),
+            SpeedMode.Demo: DriveInputConstants(
+                maxOutput=(0.4, 0.4, 0.3),
+                rateLimit=(1.0, 1.0, 1.5))
+        }
+
+    class Rumble:
+        # Each pattern is a sequence of (duration in seconds, intensity 0.0 to 1.0) steps
+        Patterns = {
+            ControllerRumblePattern.Short: ((0.15, 1.0), (0.1, 0.0), (0.15, 1.0)),
+            ControllerRumblePattern.Long: ((0.75, 1.0),)
+        }
+
+
+class Tunables:
+    # NetworkTables table the tunable values are published under, and the file (in the robot's
+    # operating directory, eg: /home/lvuser) where changed values are saved
+    TableName = 'Tunables'
+    FileName = 'tunables.json'
+
+
+class Deferred:
+    # Deferred (non-critical) work runs after the command scheduler (which runs at +5ms) and must
+    # finish before the idle garbage collection at Memory.IdleOffset
+    Offset: units.seconds = 0.010
+    Deadline: units.seconds = 0.014
+
+
+class Memory:
+    # A microsecond after the command scheduler (at +5ms), so the loop time is measured as soon
+    # as the scheduler finishes
+    LoopEndOffset: units.seconds = 0.005001
+    # Garbage collection runs in the idle time after the command scheduler and deferred work
+    IdleOffset: units.seconds = 0.015
+    MinSlack: units.seconds = 0.002
+    # Number of young generation collections before the next idle collection includes generation 1
+    Generation1Threshold = 10
+
 
 class Subsystems:
     class Drive:
@@ -49,6 +97,14 @@ class Subsystems:
                 constants=ModuleConstants)
         )
 
+        # The other module on the same side of the robot, used in place of a degraded module's encoder
+        ModulePartners = {
+            ModuleLocation.LeftFront: ModuleLocation.LeftRear,
+            ModuleLocation.LeftRear: ModuleLocation.LeftFront,
+            ModuleLocation.RightFront: ModuleLocation.RightRear,
+            ModuleLocation.RightRear: ModuleLocation.RightFront
+        }
+
         # Kinematics provide a model of how the robot will move based on wheel motion.
         # DifferentialDriveKinematics - aka: "Tank Drive"
         # MecanumDriveKinematics - Wheel can only rotate axially, diagonal rollers allow moving side-to-side
@@ -67,6 +123,21 @@ class Subsystems:
         MaxVelocity = 15
         MaxAcceleration = 3
 
+    class Health:
+        # A device that hasn't reported healthy for this long is marked degraded. Devices are
+        # polled one per cycle, so this should cover a few full rounds of polling
+        StaleTimeout: units.seconds = 0.5
+
+    class Power:
+        # The main breaker is rated for 120A; leave headroom for the roboRIO, radio and PDH
+        CurrentBudget: units.amperes = 110
+        # Output starts scaling down below ScaleStartVoltage, reaching MinOutputScale near brownout
+        ScaleStartVoltage: units.volts = 9.0
+        BrownoutVoltage: units.volts = 7.0
+        MinOutputScale = 0.3
+        # How fast (scale per second) output returns to full once the load is under control
+        ScaleRecoveryRate = 0.5
+
     class Roller:
         MotorId = 15
         MotorCurrentLimit = 20
@@ -1,4 +1,4 @@
-from typing import NamedTuple
+from typing import NamedTuple, Tuple
 from lib.enums import *
 from dataclasses import dataclass
 from wpimath import units
@@ -16,6 +16,13 @@ class Tolerance(NamedTuple):
     errorDerivative: float
 
 
+@dataclass(frozen=True, slots=True)
+class DriveInputConstants:
+    # Per axis values, ordered forward, strafe, rotation
+    maxOutput: Tuple[float, float, float]
+    rateLimit: Tuple[float, float, float]
+
+
 @dataclass(frozen=True, slots=True)
 class DriftCorrectionConstants:
     rotationPID: PID
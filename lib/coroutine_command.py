@@ -0,0 +1,147 @@
+from typing import Any, Callable, Coroutine, Generator, Optional
+from commands2 import Command, Subsystem
+from wpilib import Timer
+from wpimath import units
+
+
+class CoroutineCommand(Command):
+    """
+    A command that runs an ``async def`` function, advancing it one step per scheduler cycle.
+
+    Multi-step routines can be written as straight-line code instead of a tree of
+    sequence/parallel/withTimeout commands::
+
+        async def center():
+            await repeat(lambda: drive.setChassisSpeed(speeds), 3.25)
+            await repeat(roller.eject, 0.5)
+
+        CoroutineCommand(center, drive, roller)
+
+    The coroutine is stepped directly by :meth:`execute` - there is no event loop or thread,
+    so only the awaitables in this module (:func:`nextCycle`, :func:`wait`, :func:`waitUntil`,
+    :func:`repeat` and :func:`runCommand`) may be awaited. If the command is interrupted the
+    coroutine is closed, so ``finally`` blocks inside it still run.
+    """
+
+    _current: Optional["CoroutineCommand"] = None
+
+    def __init__(
+        self,
+        coroutine: Callable[[], Coroutine[Any, None, None]],
+        *requirements: Subsystem
+    ) -> None:
+        """
+        :param coroutine:    An ``async def`` function taking no arguments, called each time the
+                             command is initialized.
+        :param requirements: The subsystems the coroutine controls. Commands run with
+                             :func:`runCommand` may only require these subsystems.
+        """
+        super().__init__()
+        self._coroutineFunction = coroutine
+        self._coroutine: Optional[Coroutine[Any, None, None]] = None
+        self.setName(coroutine.__name__)
+        self.addRequirements(*requirements)
+
+    def initialize(self) -> None:
+        self._coroutine = self._coroutineFunction()
+
+    def execute(self) -> None:
+        if self._coroutine is None:
+            return
+        # Restored afterwards, this may be a command run by another CoroutineCommand
+        previous = CoroutineCommand._current
+        CoroutineCommand._current = self
+        try:
+            self._coroutine.send(None)
+        except StopIteration:
+            self._coroutine = None
+        finally:
+            CoroutineCommand._current = previous
+
+    def end(self, interrupted: bool) -> None:
+        if self._coroutine is not None:
+            self._coroutine.close()
+            self._coroutine = None
+
+    def isFinished(self) -> bool:
+        return self._coroutine is None
+
+
+class _Awaitable:
+    __slots__ = ('_generator',)
+
+    def __init__(self, generator: Generator[None, None, None]) -> None:
+        self._generator = generator
+
+    def __await__(self) -> Generator[None, None, None]:
+        return self._generator
+
+
+def _nextCycle() -> Generator[None, None, None]:
+    yield
+
+
+def _wait(seconds: units.seconds) -> Generator[None, None, None]:
+    end = Timer.getFPGATimestamp() + seconds
+    while Timer.getFPGATimestamp() < end:
+        yield
+
+
+def _waitUntil(condition: Callable[[], bool], timeout: Optional[units.seconds]) -> Generator[None, None, None]:
+    end = None if timeout is None else Timer.getFPGATimestamp() + timeout
+    while not condition():
+        if end is not None and Timer.getFPGATimestamp() >= end:
+            return
+        yield
+
+
+def _repeat(action: Callable[[], None], seconds: units.seconds) -> Generator[None, None, None]:
+    end = Timer.getFPGATimestamp() + seconds
+    while True:
+        action()
+        if Timer.getFPGATimestamp() >= end:
+            return
+        yield
+
+
+def _runCommand(command: Command) -> Generator[None, None, None]:
+    parent = CoroutineCommand._current
+    if parent is not None and not command.getRequirements() <= parent.getRequirements():
+        raise ValueError(f'{command.getName()} requires subsystems not required by {parent.getName()}')
+    command.initialize()
+    interrupted = True
+    try:
+        while True:
+            command.execute()
+            if command.isFinished():
+                interrupted = False
+                return
+            yield
+    finally:
+        command.end(interrupted)
+
+
+def nextCycle() -> _Awaitable:
+    """Waits until the next scheduler cycle"""
+    return _Awaitable(_nextCycle())
+
+
+def wait(seconds: units.seconds) -> _Awaitable:
+    """Waits for the given time"""
+    return _Awaitable(_wait(seconds))
+
+
+def waitUntil(condition: Callable[[], bool], timeout: Optional[units.seconds] = None) -> _Awaitable:
+    """Waits until condition returns True, or the optional timeout elapses"""
+    return _Awaitable(_waitUntil(condition, timeout))
+
+
+def repeat(action: Callable[[], None], seconds: units.seconds) -> _Awaitable:
+    """Calls action once per cycle for the given time"""
+    return _Awaitable(_repeat(action, seconds))
+
+
+def runCommand(command: Command) -> _Awaitable:
+    """Runs an existing command inline until it finishes. The command's requirements must be
+    a subset of the enclosing CoroutineCommand's requirements."""
+    return _Awaitable(_runCommand(command))
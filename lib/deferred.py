@@ -0,0 +1,114 @@
+import heapq
+import itertools
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+from wpilib import RobotController, SmartDashboard
+from lib.enums import TaskPriority
+
+
+@dataclass(slots=True)
+class DeferredTask:
+    name: str
+    action: Callable[[], None]
+    priority: TaskPriority
+    periodic: bool
+    pending: bool = False
+    # Moving average of how long the task takes to run, in microseconds
+    cost: float = 0
+    postponed: int = 0
+
+
+class DeferredScheduler:
+    """
+    Runs work that is allowed to slip (telemetry, dashboard updates, logging) in whatever
+    time is left in the current cycle after the command scheduler has run.
+
+    Tasks run highest priority first and only if their estimated cost fits before the
+    deadline; anything that doesn't fit is carried over to the next cycle. Periodic
+    tasks are queued at most once, so a task that keeps getting postponed never piles up.
+    """
+
+    _instance: Optional["DeferredScheduler"] = None
+
+    @staticmethod
+    def getInstance() -> "DeferredScheduler":
+        if DeferredScheduler._instance is None:
+            DeferredScheduler._instance = DeferredScheduler()
+        return DeferredScheduler._instance
+
+    @staticmethod
+    def resetInstance() -> None:
+        DeferredScheduler._instance = None
+
+    def __init__(self) -> None:
+        self._baseKey = 'Robot/Deferred'
+        self._queue: List[Tuple[TaskPriority, int, DeferredTask]] = []
+        self._sequence = itertools.count()
+        self._periodicTasks: List[DeferredTask] = []
+
+        self._cycles = 0
+        self._postponedCycles = 0
+        self._postponedTotal = 0
+        self._postponedLast = 0
+
+        self.addPeriodic(self._updateTelemetry, TaskPriority.Low, name=f'{self._baseKey}/Telemetry')
+
+    def schedule(
+            self,
+            action: Callable[[], None],
+            priority: TaskPriority = TaskPriority.Normal,
+            name: Optional[str] = None) -> DeferredTask:
+        """Queues action to run once, as soon as there is time for it"""
+        task = DeferredTask(name or action.__qualname__, action, priority, periodic=False)
+        self._enqueue(task)
+        return task
+
+    def addPeriodic(
+            self,
+            action: Callable[[], None],
+            priority: TaskPriority = TaskPriority.Low,
+            name: Optional[str] = None) -> DeferredTask:
+        """Queues action to run every cycle that has time for it"""
+        task = DeferredTask(name or action.__qualname__, action, priority, periodic=True)
+        self._periodicTasks.append(task)
+        return task
+
+    def getPostponed(self) -> int:
+        """Returns the number of tasks carried over from the last cycle"""
+        return self._postponedLast
+
+    def run(self, deadline: int) -> None:
+        """Runs queued tasks until the deadline (FPGA time in microseconds)"""
+        self._cycles += 1
+        for task in self._periodicTasks:
+            if not task.pending:
+                self._enqueue(task)
+
+        queue = self._queue
+        while queue:
+            task = queue[0][2]
+            start = RobotController.getFPGATime()
+            if start + task.cost > deadline:
+                break
+            heapq.heappop(queue)
+            task.pending = False
+            task.action()
+            elapsed = RobotController.getFPGATime() - start
+            task.cost = elapsed if task.cost == 0 else 0.8 * task.cost + 0.2 * elapsed
+
+        self._postponedLast = len(queue)
+        if queue:
+            self._postponedCycles += 1
+            self._postponedTotal += len(queue)
+            for _, _, task in queue:
+                task.postponed += 1
+
+    def _enqueue(self, task: DeferredTask) -> None:
+        task.pending = True
+        heapq.heappush(self._queue, (task.priority, next(self._sequence), task))
+
+    def _updateTelemetry(self) -> None:
+        SmartDashboard.putNumber(f'{self._baseKey}/Cycles', self._cycles)
+        SmartDashboard.putNumber(f'{self._baseKey}/PostponedCycles', self._postponedCycles)
+        SmartDashboard.putNumber(f'{self._baseKey}/PostponedTotal', self._postponedTotal)
+        SmartDashboard.putNumber(f'{self._baseKey}/Postponed', self._postponedLast)
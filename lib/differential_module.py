@@ -3,7 +3,7 @@ from typing import Callable, Optional, Tuple
 from wpilib import Timer
 from wpimath import units
 from rev import SparkBase, SparkBaseConfig, SparkLowLevel, SparkMax, SparkFlex
-from lib.classes import DifferentialModuleConfig, MotorIdleMode, MotorControllerType
+from lib.classes import DifferentialModuleConfig, ModuleLocation, MotorIdleMode, MotorControllerType
 from wpimath.kinematics import MecanumDriveKinematics, MecanumDriveWheelSpeeds
 from wpimath.controller import HolonomicDriveController
 from commands2 import Command, Subsystem
@@ -45,10 +45,20 @@ class DifferentialModule:
         self._drivingEncoder.setPosition(0)
 
         self._drivingTargetSpeed: units.meters_per_second = 0
+        self._degraded = False
+
+    def getLocation(self) -> ModuleLocation:
+        return self._config.location
 
     def getMotorController(self) -> SparkMax:
         return self._drivingMotor
 
+    def isDegraded(self) -> bool:
+        return self._degraded
+
+    def setDegraded(self, degraded: bool) -> None:
+        self._degraded = degraded
+
     def getPosition(self) -> float:
         return self._drivingEncoder.getPosition()
 
@@ -129,6 +139,7 @@ class DifferentialControllerCommand(Command):
         self._kinematics = kinematics
         self._outputModuleStates = outputModuleStates
         self._controller = controller
+        self._nextController: Optional[HolonomicDriveController] = None
         if desiredRotation is None:
             self._desiredRotation = trajectory.states()[-1].pose.rotation
         else:
@@ -137,7 +148,15 @@ class DifferentialControllerCommand(Command):
         self._timer = Timer()
         self.addRequirements(*requirements)
 
+    def setController(self, controller: HolonomicDriveController) -> None:
+        """Replaces the controller (eg: after tuning). Takes effect the next time the command starts,
+        so a path that is already running isn't disturbed."""
+        self._nextController = controller
+
     def initialize(self):
+        if self._nextController is not None:
+            self._controller = self._nextController
+            self._nextController = None
         self._timer.restart()
 
     def execute(self):
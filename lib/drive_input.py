@@ -0,0 +1,80 @@
+import math
+from commands2.button import CommandXboxController
+from wpilib import SendableChooser, SmartDashboard, TimedRobot
+from wpimath import units
+from wpimath.kinematics import ChassisSpeeds
+from lib.enums import SpeedMode
+import constants
+
+Constants = constants.Controllers.DriveInput
+
+
+class DriveInput:
+    """
+    Turns the driver's sticks into drive speeds: deadband, response curve, speed mode
+    scaling and slew rate limiting.
+
+    Everything that depends on the speed mode is folded into one (scale, exponent, step)
+    tuple per axis when the mode changes, so each cycle is a single pass over three values.
+    The same ChassisSpeeds is returned every cycle to avoid allocating one per cycle.
+    """
+
+    def __init__(
+        self,
+        controller: CommandXboxController,
+        period: units.seconds = TimedRobot.kDefaultPeriod / 1000
+    ) -> None:
+        self._hid = controller.getHID()
+        self._period = period
+        self._deadband = Constants.Deadband
+        self._deadbandScale = 1.0 / (1.0 - Constants.Deadband)
+        self._outputs = [0.0, 0.0, 0.0]
+        self._speeds = ChassisSpeeds()
+        self.setSpeedMode(Constants.DefaultSpeedMode)
+
+        self._speedModes = SendableChooser()
+        self._speedModes.setDefaultOption(Constants.DefaultSpeedMode.name, Constants.DefaultSpeedMode)
+        for speedMode in SpeedMode:
+            if speedMode != Constants.DefaultSpeedMode:
+                self._speedModes.addOption(speedMode.name, speedMode)
+        self._speedModes.onChange(self.setSpeedMode)
+        SmartDashboard.putData('Robot/Drive/SpeedMode', self._speedModes)
+
+    def getSpeedMode(self) -> SpeedMode:
+        return self._speedMode
+
+    def setSpeedMode(self, speedMode: SpeedMode) -> None:
+        limits = Constants.SpeedModes[speedMode]
+        self._speedMode = speedMode
+        # Stick forward/left read as negative, so the sign flip is folded into the scale
+        self._axes = tuple(
+            (-maxOutput, exponent, rateLimit * self._period)
+            for maxOutput, exponent, rateLimit in zip(limits.maxOutput, Constants.Exponents, limits.rateLimit)
+        )
+
+    def reset(self) -> None:
+        """Forgets the last output so the slew limit ramps from zero. Should be called when
+        the command using this input starts, otherwise it resumes from the speeds it had
+        when it was last interrupted or the robot was disabled."""
+        self._outputs[:] = (0.0, 0.0, 0.0)
+
+    def getChassisSpeeds(self) -> ChassisSpeeds:
+        """Samples the controller and returns the shaped speeds. Should be called once per cycle."""
+        hid = self._hid
+        deadband = self._deadband
+        deadbandScale = self._deadbandScale
+        outputs = self._outputs
+        raw = (hid.getLeftY(), hid.getLeftX(), hid.getRightY())
+        for i, (value, (scale, exponent, step)) in enumerate(zip(raw, self._axes)):
+            magnitude = abs(value) - deadband
+            target = math.copysign((magnitude * deadbandScale) ** exponent, value) * scale if magnitude > 0 else 0.0
+            previous = outputs[i]
+            if target > previous + step:
+                target = previous + step
+            elif target < previous - step:
+                target = previous - step
+            outputs[i] = target
+
+        speeds = self._speeds
+        speeds.vx, speeds.vy, speeds.omega = outputs
+        return speeds
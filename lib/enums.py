@@ -57,6 +57,11 @@ class ControllerRumblePattern(Enum):
   Short = auto()
   Long = auto()
 
+class TaskPriority(IntEnum):
+  High = auto()
+  Normal = auto()
+  Low = auto()
+
 class ModuleLocation(IntEnum):
   LeftFront = auto()
   LeftRear = auto()
@@ -0,0 +1,148 @@
+import gc
+import sys
+import time
+from dataclasses import dataclass
+from wpilib import RobotController, SmartDashboard, TimedRobot
+from wpimath import units
+from lib.enums import RobotMode
+from lib.utils import CycleClock
+
+
+@dataclass(slots=True)
+class MemoryStats:
+    cycles: int = 0
+    # Net new objects tracked by the collector (what triggers collections). wpimath types such
+    # as ChassisSpeeds and Rotation2d aren't tracked, so they can't cause a collection
+    trackedAllocations: int = 0
+    # Net growth in memory blocks held by Python's allocator, which does include wpimath objects.
+    # Objects created and freed within a cycle cancel out, so this shows what each cycle keeps
+    allocatedBlocks: int = 0
+    collections: int = 0
+    pauseTotal: units.seconds = 0
+    pauseMax: units.seconds = 0
+    # Time from the start of a cycle until the main loop and command scheduler had both finished
+    loopTimeMax: units.seconds = 0
+    slackMin: units.seconds = float('inf')
+    skippedCollections: int = 0
+
+
+class MemoryManager:
+    """
+    Keeps CPython's cyclic garbage collector from pausing the robot mid-cycle.
+
+    Objects created during startup are frozen so collections never scan them again.
+    Automatic collection is disabled while the robot is enabled; instead a young
+    generation collection is run at the end of each cycle, but only when enough time
+    is left before the next cycle starts. Full automatic collection resumes when
+    the robot is disabled. The time left is measured from the cycle start that the
+    main loop records in clock.
+    """
+
+    def __init__(
+        self,
+        robot: TimedRobot,
+        clock: CycleClock,
+        loopEndOffset: units.seconds,
+        idleOffset: units.seconds,
+        minSlack: units.seconds,
+        generation1Threshold: int
+    ) -> None:
+        self._period: units.seconds = robot.getPeriod()
+        self._clock = clock
+        self._minSlack = minSlack
+        self._generation1Threshold = generation1Threshold
+        self._baseKey = 'Robot/Memory'
+
+        self._mode = RobotMode.Disabled
+        self._stats = dict((mode, MemoryStats()) for mode in RobotMode)
+        self._pauseStart: float = 0
+        self._lastCount = gc.get_count()[0]
+        self._lastBlocks = sys.getallocatedblocks()
+
+        gc.callbacks.append(self._onCollection)
+        robot.addPeriodic(self._onLoopEnd, self._period, loopEndOffset)
+        robot.addPeriodic(self.periodic, self._period, idleOffset)
+
+    def freeze(self) -> None:
+        """Moves everything allocated so far (subsystems, commands, kinematics) out of the
+        collector's reach. Should be called once at the end of robotInit."""
+        gc.collect()
+        gc.freeze()
+        # Startup isn't counted as an allocation in the first cycle
+        self._lastCount = gc.get_count()[0]
+        self._lastBlocks = sys.getallocatedblocks()
+
+    def setMode(self, mode: RobotMode) -> None:
+        """Called when the robot changes mode, enables or disables automatic collection"""
+        self._updateTelemetry()
+        self._mode = mode
+        if mode == RobotMode.Disabled:
+            gc.enable()
+        else:
+            gc.disable()
+
+    def getStats(self, mode: RobotMode) -> MemoryStats:
+        return self._stats[mode]
+
+    def periodic(self) -> None:
+        """Runs in the idle time at the end of each cycle"""
+        stats = self._stats[self._mode]
+        stats.cycles += 1
+        counts = gc.get_count()
+        stats.trackedAllocations += counts[0] - self._lastCount
+        self._lastCount = counts[0]
+        blocks = sys.getallocatedblocks()
+        stats.allocatedBlocks += blocks - self._lastBlocks
+
+        # Time left before the next cycle starts. This shrinks (or goes negative) when the
+        # main loop or the scheduler overran, so the worst case is tracked per mode
+        slack = (self._clock.getCycleEnd() - RobotController.getFPGATime()) / 1e6
+        if slack < stats.slackMin:
+            stats.slackMin = slack
+
+        if gc.isenabled():
+            self._lastBlocks = blocks
+            return
+        if slack < self._minSlack:
+            stats.skippedCollections += 1
+            self._lastBlocks = blocks
+            return
+        gc.collect(1 if counts[1] >= self._generation1Threshold else 0)
+        # Blocks freed by the collection were counted when they were allocated
+        self._lastBlocks = sys.getallocatedblocks()
+
+    def _onLoopEnd(self) -> None:
+        """Runs as soon as the command scheduler has finished"""
+        loopTime = (RobotController.getFPGATime() - self._clock.getCycleStart()) / 1e6
+        stats = self._stats[self._mode]
+        if loopTime > stats.loopTimeMax:
+            stats.loopTimeMax = loopTime
+
+    def _onCollection(self, phase: str, info: dict) -> None:
+        if phase == 'start':
+            # The young generation count (net new container objects) is reset by the collection
+            self._stats[self._mode].trackedAllocations += gc.get_count()[0] - self._lastCount
+            self._lastCount = 0
+            self._pauseStart = time.perf_counter()
+            return
+        pause = time.perf_counter() - self._pauseStart
+        stats = self._stats[self._mode]
+        stats.collections += 1
+        stats.pauseTotal += pause
+        if pause > stats.pauseMax:
+            stats.pauseMax = pause
+
+    def _updateTelemetry(self) -> None:
+        stats = self._stats[self._mode]
+        if stats.cycles == 0:
+            return
+        baseKey = f'{self._baseKey}/{self._mode.name}'
+        SmartDashboard.putNumber(f'{baseKey}/Cycles', stats.cycles)
+        SmartDashboard.putNumber(f'{baseKey}/TrackedAllocations', stats.trackedAllocations)
+        SmartDashboard.putNumber(f'{baseKey}/AllocatedBlocks', stats.allocatedBlocks)
+        SmartDashboard.putNumber(f'{baseKey}/Collections', stats.collections)
+        SmartDashboard.putNumber(f'{baseKey}/SkippedCollections', stats.skippedCollections)
+        SmartDashboard.putNumber(f'{baseKey}/PauseTotalMs', stats.pauseTotal * 1000)
+        SmartDashboard.putNumber(f'{baseKey}/PauseMaxMs', stats.pauseMax * 1000)
+        SmartDashboard.putNumber(f'{baseKey}/LoopTimeMaxMs', stats.loopTimeMax * 1000)
+        SmartDashboard.putNumber(f'{baseKey}/SlackMinMs', stats.slackMin * 1000)
@@ -0,0 +1,136 @@
+import json
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from ntcore import EventFlags, NetworkTableInstance, NetworkTableListenerPoller
+from wpilib import getOperatingDirectory, reportWarning
+
+from lib.deferred import DeferredScheduler
+from lib.enums import TaskPriority
+import constants
+
+Constants = constants.Tunables
+
+
+class Tunable:
+    """A value that can be changed while the robot is running.
+
+    Read ``value`` directly in periodic code - it is a plain attribute that is only
+    updated when a change arrives. Use :meth:`subscribe` to react to changes instead
+    (eg: to reconfigure a motor controller).
+    """
+
+    __slots__ = ('key', 'default', 'value', '_subscribers')
+
+    def __init__(self, key: str, default: float, value: float) -> None:
+        self.key = key
+        self.default = default
+        self.value = value
+        self._subscribers: List[Callable[[float], None]] = []
+
+    def subscribe(self, callback: Callable[[float], None]) -> None:
+        """Calls callback with the new value every time it changes"""
+        self._subscribers.append(callback)
+
+    def _set(self, value: float) -> bool:
+        if value == self.value:
+            return False
+        self.value = value
+        for callback in self._subscribers:
+            callback(value)
+        return True
+
+
+class Tunables:
+    """
+    Tunable values, layered: defaults from constants.py, then values saved to a file on the
+    robot, then values changed in NetworkTables (under /Tunables) while the robot is running.
+
+    NetworkTables changes are collected once per cycle as deferred work and applied on the
+    robot thread; values that differ from their defaults are saved so they survive a restart.
+    """
+
+    _instance: Optional["Tunables"] = None
+
+    @staticmethod
+    def getInstance() -> "Tunables":
+        if Tunables._instance is None:
+            Tunables._instance = Tunables(Path(getOperatingDirectory()) / Constants.FileName)
+        return Tunables._instance
+
+    @staticmethod
+    def resetInstance() -> None:
+        if Tunables._instance is not None:
+            Tunables._instance._poller.close()
+        Tunables._instance = None
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._saved: Dict[str, float] = self._load()
+        self._tunables: Dict[str, Tunable] = {}
+        self._savePending = False
+
+        instance = NetworkTableInstance.getDefault()
+        self._table = instance.getTable(Constants.TableName)
+        self._prefix = f'/{Constants.TableName}/'
+        self._poller = NetworkTableListenerPoller(instance)
+        self._poller.addListener([self._prefix], EventFlags.kValueAll)
+        DeferredScheduler.getInstance().addPeriodic(
+            self.poll, TaskPriority.Normal, name=f'Robot/{Constants.TableName}/Poll')
+
+    def add(self, key: str, default: float) -> Tunable:
+        """Registers a tunable value. default should come from constants.py."""
+        tunable = self._tunables.get(key)
+        if tunable is not None:
+            return tunable
+
+        entry = self._table.getEntry(key)
+        entry.setDefaultDouble(self._saved.get(key, default))
+        tunable = Tunable(key, default, entry.getDouble(default))
+        self._tunables[key] = tunable
+        return tunable
+
+    def get(self, key: str) -> Tunable:
+        return self._tunables[key]
+
+    def poll(self) -> None:
+        """Applies changes made in NetworkTables since the last call"""
+        changed = False
+        for event in self._poller.readQueue():
+            name = event.data.topic.getName()
+            tunable = self._tunables.get(name[len(self._prefix):])
+            if tunable is not None and event.data.value.isDouble():
+                changed |= tunable._set(event.data.value.getDouble())
+
+        if changed and not self._savePending:
+            self._savePending = True
+            DeferredScheduler.getInstance().schedule(self._save, TaskPriority.Low)
+
+    def _load(self) -> Dict[str, float]:
+        """Reads saved values, skipping anything invalid so one bad entry can't stop the robot starting"""
+        if not self._path.exists():
+            return {}
+        try:
+            saved = json.loads(self._path.read_text())
+        except (OSError, ValueError) as e:
+            reportWarning(f'Ignoring unreadable tunables file {self._path}: {e}')
+            return {}
+        if not isinstance(saved, dict):
+            reportWarning(f'Ignoring tunables file {self._path}: expected an object, not {type(saved).__name__}')
+            return {}
+
+        values: Dict[str, float] = {}
+        for key, value in saved.items():
+            try:
+                values[key] = float(value)
+            except (TypeError, ValueError):
+                reportWarning(f'Ignoring invalid saved tunable {key}: {value!r}')
+        return values
+
+    def _save(self) -> None:
+        self._savePending = False
+        for tunable in self._tunables.values():
+            if tunable.value != tunable.default:
+                self._saved[tunable.key] = tunable.value
+            else:
+                self._saved.pop(tunable.key, None)
+        self._path.write_text(json.dumps(dict(sorted(self._saved.items())), indent=2) + '\n')
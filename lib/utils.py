@@ -0,0 +1,29 @@
+from wpilib import RobotController
+from wpimath import units
+
+
+class CycleClock:
+    """
+    Tracks when the robot's current cycle started, for code running in addPeriodic callbacks.
+
+    Inside a callback, TimedRobot.getLoopStartTime() is the time that callback woke up, not
+    the time the main loop started, so callbacks can't use it to tell how much of the cycle
+    is left. The main loop records its own loop start time with :meth:`startCycle` (eg: from
+    robotPeriodic) and the callbacks later in the cycle measure from that.
+    """
+
+    def __init__(self, period: units.seconds) -> None:
+        self._period = int(period * 1e6)
+        self._cycleStart = RobotController.getFPGATime()
+
+    def startCycle(self, loopStartTime: int) -> None:
+        """Should be called from the main loop with TimedRobot.getLoopStartTime()"""
+        self._cycleStart = loopStartTime
+
+    def getCycleStart(self) -> int:
+        """FPGA time (us) the current cycle's main loop started"""
+        return self._cycleStart
+
+    def getCycleEnd(self) -> int:
+        """FPGA time (us) the next main loop is due"""
+        return self._cycleStart + self._period
@@ -10,6 +10,11 @@ import commands2
 import typing
 
 from robotcontainer import RobotContainer
+from lib.enums import RobotMode
+from lib.deferred import DeferredScheduler
+from lib.memory import MemoryManager
+from lib.utils import CycleClock
+import constants
 
 
 class Robot(commands2.TimedCommandRobot):
@@ -20,6 +25,16 @@ class Robot(commands2.TimedCommandRobot):
     def __init__(self):
         """Calls the TimedCommandRobot __init__ method"""
         super().__init__()
+        self._clock = CycleClock(self.getPeriod())
+        self.addPeriodic(self._runDeferred, self.getPeriod(), constants.Deferred.Offset)
+        self._memory = MemoryManager(
+            self,
+            self._clock,
+            loopEndOffset=constants.Memory.LoopEndOffset,
+            idleOffset=constants.Memory.IdleOffset,
+            minSlack=constants.Memory.MinSlack,
+            generation1Threshold=constants.Memory.Generation1Threshold
+        )
 
     def robotInit(self) -> None:
         """
@@ -32,17 +47,28 @@ class Robot(commands2.TimedCommandRobot):
         # autonomous chooser on the dashboard.
         self.container = RobotContainer()
 
+        # Everything created so far lives for the whole match, stop the garbage collector scanning it
+        self._memory.freeze()
+
     def robotPeriodic(self):
         """Called periodically for all modes"""
+        # Only here, in the main loop, is the loop start time the start of the cycle
+        self._clock.startCycle(self.getLoopStartTime())
+
+    def _runDeferred(self) -> None:
+        """Runs non-critical work in the time left after the command scheduler"""
+        DeferredScheduler.getInstance().run(self._clock.getCycleStart() + int(constants.Deferred.Deadline * 1e6))
 
     def disabledInit(self) -> None:
         """Called once each time the robot enters Disabled mode."""
+        self._memory.setMode(RobotMode.Disabled)
 
     def disabledPeriodic(self) -> None:
         """Called periodically when disabled"""
 
     def autonomousInit(self) -> None:
         """Called once when beginning autonomous. Should schedule the selected autonomous command."""
+        self._memory.setMode(RobotMode.Auto)
         self.autonomousCommand = self.container.getAutonomousCommand()
 
         if self.autonomousCommand:
@@ -53,6 +79,7 @@ class Robot(commands2.TimedCommandRobot):
 
     def teleopInit(self) -> None:
         """Called once each time the robot enters TeleOp mode."""
+        self._memory.setMode(RobotMode.Teleop)
         # This makes sure that the autonomous stops running when
         # teleop starts running. If you want the autonomous to
         # continue until interrupted by another command, remove
@@ -65,6 +92,7 @@ class Robot(commands2.TimedCommandRobot):
 
     def testInit(self) -> None:
         """Called once for each test."""
+        self._memory.setMode(RobotMode.Test)
         # Cancels all running commands at the start of test mode
         commands2.CommandScheduler.getInstance().cancelAll()
 
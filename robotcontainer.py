@@ -9,9 +9,12 @@ import commands2
 import constants
 from subsystems.drive import Drive
 from subsystems.roller import Roller
+from subsystems.power import Power
+from subsystems.health import Health
+from subsystems.rumble import Rumble
 from commands.auto import Auto
 from commands.game import Game
-from wpimath.kinematics import ChassisSpeeds
+from lib.drive_input import DriveInput
 
 # Create an alias to simplify usage
 cmd = commands2.cmd
@@ -47,6 +50,10 @@ class RobotContainer:
         """Initializes subsystems. Should only be called from __init__"""
         self._drive = Drive()
         self._roller = Roller()
+        # Every subsystem's periodic() runs before any command executes, so the output scale
+        # Power sets is applied to the commands driving the motors in the same cycle
+        self._power = Power(self._drive, self._roller)
+        self._health = Health(self._drive, self._roller)
 
     def _initControllers(self):
         self._driverController = commands2.button.CommandXboxController(
@@ -55,6 +62,8 @@ class RobotContainer:
         self._operatorController = commands2.button.CommandXboxController(
             constants.Controllers.OperatorPort
         )
+        self._driveInput = DriveInput(self._driverController)
+        self._rumble = Rumble(self._driverController, self._operatorController)
 
     def _initCommands(self):
         """Initializes commands. Should only be called from __init__"""
@@ -63,12 +72,7 @@ class RobotContainer:
 
         # Set default commands for all subsystems
         self._drive.setDefaultCommand(
-            self._drive.driveCommand(
-                lambda: ChassisSpeeds(
-                    -self._driverController.getLeftY(),
-                    -self._driverController.getLeftX(),
-                    -self._driverController.getRightY())
-            )
+            self._drive.driveCommand(self._driveInput.getChassisSpeeds, self._driveInput.reset)
         )
         self._roller.setDefaultCommand(
             self._roller.stopCommand()
@@ -1,10 +1,12 @@
 ﻿from commands2 import Subsystem, Command
-from typing import Callable
+from typing import Callable, Dict, Tuple
 from wpilib.drive import MecanumDrive
+from rev import SparkBase
 from wpimath.geometry import Pose2d, Rotation2d
 from wpimath.kinematics import ChassisSpeeds, MecanumDriveWheelSpeeds, MecanumDriveOdometry, MecanumDriveWheelPositions
 
-from lib.enums import ModuleLocation
+from lib.enums import ModuleLocation, TaskPriority
+from lib.deferred import DeferredScheduler
 from lib.differential_module import DifferentialModule
 import constants
 
@@ -26,6 +28,9 @@ class Drive(Subsystem):
             self._differentialModules[ModuleLocation.RightFront].getMotorController(),
             self._differentialModules[ModuleLocation.RightRear].getMotorController()
         )
+        # Module used to read each wheel's position. A degraded module's stale encoder is replaced
+        # by the other module on the same side, since both wheels on a side travel together
+        self._positionSources: Dict[ModuleLocation, DifferentialModule] = dict(self._differentialModules)
 
         # TODO: Get initial pose from a localization system
         self._odometry = MecanumDriveOdometry(
@@ -34,7 +39,28 @@ class Drive(Subsystem):
             wheelPositions=self.getWheelPositions(),
             initialPose=Pose2d()
         )
+
+        # Telemetry can slip a cycle, so it runs as deferred work rather than in periodic()
+        DeferredScheduler.getInstance().addPeriodic(
+            self._updateTelemetry, TaskPriority.Low, name='Robot/Drive/Telemetry')
     
+    def getModules(self) -> Tuple[DifferentialModule, ...]:
+        return tuple(self._differentialModules.values())
+
+    def setModuleDegraded(self, location: ModuleLocation, degraded: bool) -> None:
+        """Marks a module as unreliable (eg: it dropped off the CAN bus) so odometry stops using it"""
+        self._differentialModules[location].setDegraded(degraded)
+        for moduleLocation, module in self._differentialModules.items():
+            partner = self._differentialModules[Constants.ModulePartners[moduleLocation]]
+            self._positionSources[moduleLocation] = partner if module.isDegraded() and not partner.isDegraded() else module
+
+    def getMotorControllers(self) -> Tuple[SparkBase, ...]:
+        return tuple(module.getMotorController() for module in self._differentialModules.values())
+
+    def setMaxOutput(self, maxOutput: float) -> None:
+        """Scales all drive output, eg: to reduce current draw"""
+        self._drivetrain.setMaxOutput(maxOutput)
+
     def getHeading(self) -> Rotation2d:
         """Gets the robot's current heading (typically from a gyro)"""
         return Rotation2d()
@@ -59,9 +85,11 @@ class Drive(Subsystem):
 
     def driveCommand(
             self,
-            get_input: Callable[[], ChassisSpeeds]) -> Command:
-        """Returns a command that drives the robot"""
-        return self.run(
+            get_input: Callable[[], ChassisSpeeds],
+            on_start: Callable[[], None] = lambda: None) -> Command:
+        """Returns a command that drives the robot. on_start is called each time the command starts."""
+        return self.startRun(
+            on_start,
             lambda: self.setChassisSpeed(get_input())
         )
 
@@ -94,8 +122,12 @@ class Drive(Subsystem):
 
     def getWheelPositions(self) -> MecanumDriveWheelPositions:
         wheelPositions = MecanumDriveWheelPositions()
-        wheelPositions.frontLeft = self._differentialModules[ModuleLocation.LeftFront].getPosition()
-        wheelPositions.frontRight = self._differentialModules[ModuleLocation.RightFront].getPosition()
-        wheelPositions.rearLeft = self._differentialModules[ModuleLocation.LeftRear].getPosition()
-        wheelPositions.rearRight = self._differentialModules[ModuleLocation.RightRear].getPosition()
+        wheelPositions.frontLeft = self._positionSources[ModuleLocation.LeftFront].getPosition()
+        wheelPositions.frontRight = self._positionSources[ModuleLocation.RightFront].getPosition()
+        wheelPositions.rearLeft = self._positionSources[ModuleLocation.LeftRear].getPosition()
+        wheelPositions.rearRight = self._positionSources[ModuleLocation.RightRear].getPosition()
         return wheelPositions
+
+    def _updateTelemetry(self) -> None:
+        for module in self._differentialModules.values():
+            module._updateTelemetry()
@@ -0,0 +1,102 @@
+from commands2 import Subsystem
+from typing import NamedTuple, Optional
+from rev import REVLibError, SparkBase
+from wpilib import Alert, SmartDashboard, Timer
+
+from lib.deferred import DeferredScheduler
+from lib.enums import ModuleLocation, TaskPriority
+from subsystems.drive import Drive
+from subsystems.roller import Roller
+import constants
+
+Constants = constants.Subsystems.Health
+
+
+class HealthSummary(NamedTuple):
+    devices: int
+    degraded: int
+    faulted: int
+    # Bit n is set when device n (in polling order) is degraded
+    degradedMask: int
+
+
+class _Device:
+    __slots__ = ('name', 'motor', 'location', 'lastHealthy', 'degraded', 'stickyFaults',
+                 'degradedAlert', 'faultAlert')
+
+    def __init__(self, name: str, motor: SparkBase, location: Optional[ModuleLocation], now: float) -> None:
+        self.name = name
+        self.motor = motor
+        self.location = location
+        self.lastHealthy = now
+        self.degraded = False
+        self.stickyFaults = 0
+        self.degradedAlert = Alert(f'{name} (CAN {motor.getDeviceId()}) is not responding', Alert.AlertType.kError)
+        self.faultAlert = Alert(f'{name} has sticky faults', Alert.AlertType.kWarning)
+
+
+class Health(Subsystem):
+    """Watches the drive and roller motor controllers for faults and CAN dropouts.
+
+    One device is polled per cycle, so the cost is the same every cycle no matter how many
+    devices there are. A device that hasn't reported healthy within StaleTimeout raises an
+    alert, and degraded drive modules are reported to Drive so odometry can work around them.
+    """
+
+    def __init__(self, drive: Drive, roller: Roller) -> None:
+        super().__init__()
+        self._baseKey = 'Robot/Health'
+        self._drive = drive
+        now = Timer.getFPGATimestamp()
+        self._devices = tuple(
+            [_Device(f'Drive/{module.getLocation().name}', module.getMotorController(), module.getLocation(), now)
+             for module in drive.getModules()] +
+            [_Device('Roller', roller.getMotorController(), None, now)])
+        self._index = 0
+        self._summary = HealthSummary(len(self._devices), 0, 0, 0)
+
+        DeferredScheduler.getInstance().addPeriodic(
+            self._updateTelemetry, TaskPriority.Low, name=f'{self._baseKey}/Telemetry')
+
+    def getSummary(self) -> HealthSummary:
+        return self._summary
+
+    def periodic(self) -> None:
+        device = self._devices[self._index]
+        self._index = (self._index + 1) % len(self._devices)
+
+        now = Timer.getFPGATimestamp()
+        motor = device.motor
+        if not motor.getFaults().can and motor.getLastError() == REVLibError.kOk:
+            device.lastHealthy = now
+        degraded = now - device.lastHealthy > Constants.StaleTimeout
+        stickyFaults = motor.getStickyFaults().rawBits
+        if degraded != device.degraded or stickyFaults != device.stickyFaults:
+            self._updateDevice(device, degraded, stickyFaults)
+
+    def _updateDevice(self, device: _Device, degraded: bool, stickyFaults: int) -> None:
+        if degraded != device.degraded:
+            device.degraded = degraded
+            device.degradedAlert.set(degraded)
+            if device.location is not None:
+                self._drive.setModuleDegraded(device.location, degraded)
+        if stickyFaults != device.stickyFaults:
+            device.stickyFaults = stickyFaults
+            device.faultAlert.setText(f'{device.name} has sticky faults (0x{stickyFaults:x})')
+            device.faultAlert.set(stickyFaults != 0)
+
+        degradedMask = 0
+        for i, d in enumerate(self._devices):
+            if d.degraded:
+                degradedMask |= 1 << i
+        self._summary = HealthSummary(
+            devices=len(self._devices),
+            degraded=sum(d.degraded for d in self._devices),
+            faulted=sum(d.stickyFaults != 0 for d in self._devices),
+            degradedMask=degradedMask)
+
+    def _updateTelemetry(self) -> None:
+        summary = self._summary
+        SmartDashboard.putNumber(f'{self._baseKey}/Degraded', summary.degraded)
+        SmartDashboard.putNumber(f'{self._baseKey}/Faulted', summary.faulted)
+        SmartDashboard.putNumber(f'{self._baseKey}/DegradedMask', summary.degradedMask)
@@ -0,0 +1,96 @@
+from commands2 import Subsystem
+from wpilib import RobotController, SmartDashboard, TimedRobot
+from wpimath import units
+
+from lib.deferred import DeferredScheduler
+from lib.enums import TaskPriority
+from subsystems.drive import Drive
+from subsystems.roller import Roller
+import constants
+
+Constants = constants.Subsystems.Power
+
+
+class Power(Subsystem):
+    """Keeps the robot out of brownout by scaling back drive and roller output.
+
+    Battery voltage and the output current of every motor are read together once per
+    cycle. The output scale drops immediately when total current goes over budget or
+    the voltage sags, and recovers gradually once the load is back under control.
+    Current is measured with the scale already applied, so when it is over budget the
+    existing scale is reduced in proportion rather than replaced.
+    """
+
+    def __init__(
+        self,
+        drive: Drive,
+        roller: Roller,
+        period: units.seconds = TimedRobot.kDefaultPeriod / 1000
+    ) -> None:
+        super().__init__()
+        self._baseKey = 'Robot/Power'
+        self._drive = drive
+        self._roller = roller
+        self._currentReaders = tuple(
+            motor.getOutputCurrent for motor in (*drive.getMotorControllers(), roller.getMotorController()))
+        self._recoveryStep = Constants.ScaleRecoveryRate * period
+        self._voltageRange = Constants.ScaleStartVoltage - Constants.BrownoutVoltage
+
+        self._scale = 1.0
+        self._voltage = 0.0
+        self._current = 0.0
+        self._cycles = 0
+        self._currentLimitedCycles = 0
+        self._voltageLimitedCycles = 0
+        self._interventions = 0
+
+        DeferredScheduler.getInstance().addPeriodic(
+            self._updateTelemetry, TaskPriority.Low, name=f'{self._baseKey}/Telemetry')
+
+    def getScale(self) -> float:
+        return self._scale
+
+    def periodic(self) -> None:
+        voltage = RobotController.getBatteryVoltage()
+        current = 0.0
+        for read in self._currentReaders:
+            current += read()
+        self._voltage = voltage
+        self._current = current
+        self._cycles += 1
+
+        target = 1.0
+        overBudget = current > Constants.CurrentBudget
+        if overBudget:
+            target = self._scale * Constants.CurrentBudget / current
+            self._currentLimitedCycles += 1
+        if voltage < Constants.ScaleStartVoltage:
+            voltageScale = (voltage - Constants.BrownoutVoltage) / self._voltageRange
+            if voltageScale < target:
+                target = voltageScale
+            self._voltageLimitedCycles += 1
+        if target < Constants.MinOutputScale:
+            target = Constants.MinOutputScale
+
+        scale = self._scale
+        if target < scale:
+            if scale == 1.0:
+                self._interventions += 1
+            scale = target
+        elif scale < 1.0 and not overBudget:
+            scale = min(target, scale + self._recoveryStep)
+        else:
+            return
+
+        self._scale = scale
+        self._drive.setMaxOutput(scale)
+        self._roller.setOutputScale(scale)
+
+    def _updateTelemetry(self) -> None:
+        SmartDashboard.putNumber(f'{self._baseKey}/Voltage', self._voltage)
+        SmartDashboard.putNumber(f'{self._baseKey}/Current', self._current)
+        SmartDashboard.putNumber(f'{self._baseKey}/Scale', self._scale)
+        SmartDashboard.putNumber(f'{self._baseKey}/Interventions', self._interventions)
+        SmartDashboard.putNumber(f'{self._baseKey}/CurrentLimitedCycles', self._currentLimitedCycles)
+        SmartDashboard.putNumber(f'{self._baseKey}/VoltageLimitedCycles', self._voltageLimitedCycles)
+        SmartDashboard.putNumber(f'{self._baseKey}/Cycles', self._cycles)
@@ -1,5 +1,6 @@
 from commands2 import Subsystem, Command
 from typing import Callable
+from lib.tunables import Tunables
 import constants
 import rev
 
@@ -10,6 +11,11 @@ class Roller(Subsystem):
     """Runs the roller, ejecting coral"""
 
     def __init__(self):
+        tunables = Tunables.getInstance()
+        ejectSpeed = tunables.add('Roller/EjectSpeed', Constants.EjectSpeed)
+        reverseSpeed = tunables.add('Roller/ReverseSpeed', Constants.ReverseSpeed)
+        currentLimit = tunables.add('Roller/MotorCurrentLimit', Constants.MotorCurrentLimit)
+
         self._motor = rev.SparkMax(
             Constants.MotorId,
             rev.SparkBase.MotorType.kBrushless
@@ -18,21 +24,54 @@ class Roller(Subsystem):
         spark_config = rev.SparkMaxConfig() \
             .inverted(True) \
             .voltageCompensation(Constants.MotorVComp) \
-            .smartCurrentLimit(Constants.MotorCurrentLimit)
+            .smartCurrentLimit(int(currentLimit.value))
         self._motor.configure(
             spark_config,
             rev.SparkBase.ResetMode.kResetSafeParameters,
             rev.SparkBase.PersistMode.kPersistParameters)
+        self._outputScale = 1.0
+
+        self._setEjectSpeed(ejectSpeed.value)
+        self._setReverseSpeed(reverseSpeed.value)
+        ejectSpeed.subscribe(self._setEjectSpeed)
+        reverseSpeed.subscribe(self._setReverseSpeed)
+        currentLimit.subscribe(self._setCurrentLimit)
+
+    def _setEjectSpeed(self, speed: float) -> None:
+        self._ejectSpeed = speed
+
+    def _setReverseSpeed(self, speed: float) -> None:
+        self._reverseSpeed = speed
+
+    def _setCurrentLimit(self, limit: float) -> None:
+        # Called while the robot is running, so the configuration is sent without waiting
+        # for the controller to acknowledge it (configure() can block for the CAN timeout)
+        self._motor.configureAsync(
+            rev.SparkMaxConfig().smartCurrentLimit(int(limit)),
+            rev.SparkBase.ResetMode.kNoResetSafeParameters,
+            rev.SparkBase.PersistMode.kNoPersistParameters)
+
+    def getMotorController(self) -> rev.SparkMax:
+        return self._motor
+
+    def setOutputScale(self, scale: float) -> None:
+        """Scales roller speed, eg: to reduce current draw"""
+        self._outputScale = scale
+
+    def stop(self) -> None:
+        self._motor.stopMotor()
+
+    def eject(self) -> None:
+        self._motor.set(self._ejectSpeed * self._outputScale)
+
+    def reverse(self) -> None:
+        self._motor.set(self._reverseSpeed * self._outputScale)
 
     def stopCommand(self) -> Command:
-        return self.runOnce(self._motor.stopMotor)
+        return self.runOnce(self.stop)
 
     def ejectCommand(self) -> Command:
-        return self.run(
-            lambda: self._motor.set(Constants.EjectSpeed)
-        ).andThen(self.stopCommand())
+        return self.run(self.eject).andThen(self.stopCommand())
 
     def reverseCommand(self) -> Command:
-        return self.run(
-            lambda: self._motor.set(Constants.ReverseSpeed)
-        ).andThen(self.stopCommand())
+        return self.run(self.reverse).andThen(self.stopCommand())
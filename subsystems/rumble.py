@@ -0,0 +1,92 @@
+from commands2 import Subsystem
+from commands2.button import CommandXboxController
+from typing import List, Optional, Tuple
+from wpilib import Timer
+from wpilib.interfaces import GenericHID
+
+from lib.enums import ControllerRumbleMode, ControllerRumblePattern
+import constants
+
+Constants = constants.Controllers.Rumble
+
+
+class Rumble(Subsystem):
+    """Plays rumble patterns on the driver and operator controllers.
+
+    Patterns come from a precomputed table and are advanced in periodic() with a single
+    timer read per cycle. Requesting a pattern only updates a few fields, so it never
+    schedules a command or allocates. Overlapping requests are coalesced: whichever
+    pattern finishes last keeps playing.
+    """
+
+    def __init__(
+        self,
+        driverController: CommandXboxController,
+        operatorController: CommandXboxController
+    ) -> None:
+        super().__init__()
+        self._hids = (driverController.getHID(), operatorController.getHID())
+        self._targets = {
+            ControllerRumbleMode.Both: (0, 1),
+            ControllerRumbleMode.Driver: (0,),
+            ControllerRumbleMode.Operator: (1,)
+        }
+        # Each pattern becomes a tuple of (time since start the step ends, intensity)
+        self._patterns = dict(
+            (pattern, self._compile(steps)) for pattern, steps in Constants.Patterns.items())
+
+        count = len(self._hids)
+        self._now: float = Timer.getFPGATimestamp()
+        self._active: List[Optional[Tuple[Tuple[float, float], ...]]] = [None] * count
+        self._start: List[float] = [0.0] * count
+        self._end: List[float] = [0.0] * count
+        self._step: List[int] = [0] * count
+        self._intensity: List[float] = [0.0] * count
+
+    @staticmethod
+    def _compile(steps: Tuple[Tuple[float, float], ...]) -> Tuple[Tuple[float, float], ...]:
+        compiled = []
+        end = 0.0
+        for duration, intensity in steps:
+            end += duration
+            compiled.append((end, intensity))
+        return tuple(compiled)
+
+    def rumble(self, mode: ControllerRumbleMode, pattern: ControllerRumblePattern) -> None:
+        """Starts a pattern on the selected controllers. It begins on the next cycle."""
+        steps = self._patterns[pattern]
+        end = self._now + steps[-1][0]
+        for i in self._targets[mode]:
+            if end > self._end[i]:
+                self._active[i] = steps
+                self._start[i] = self._now
+                self._end[i] = end
+                self._step[i] = 0
+
+    def stop(self) -> None:
+        for i, hid in enumerate(self._hids):
+            self._active[i] = None
+            self._end[i] = 0.0
+            self._intensity[i] = 0.0
+            hid.setRumble(GenericHID.RumbleType.kBothRumble, 0.0)
+
+    def periodic(self) -> None:
+        now = Timer.getFPGATimestamp()
+        self._now = now
+        for i, steps in enumerate(self._active):
+            if steps is None:
+                continue
+            elapsed = now - self._start[i]
+            step = self._step[i]
+            while step < len(steps) and elapsed >= steps[step][0]:
+                step += 1
+            if step == len(steps):
+                self._active[i] = None
+                self._end[i] = 0.0
+                intensity = 0.0
+            else:
+                self._step[i] = step
+                intensity = steps[step][1]
+            if intensity != self._intensity[i]:
+                self._intensity[i] = intensity
+                self._hids[i].setRumble(GenericHID.RumbleType.kBothRumble, intensity)
@@ -0,0 +1,248 @@
+"""
+Shared fixtures for running robot code off-robot.
+
+The simulated HAL that ships with wpilib stands in for the roboRIO, and
+``tests/mocks`` is put first on the import path so ``import rev`` resolves to
+our lightweight REVLib stand-in instead of the vendor library.
+"""
+import gc
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from statistics import median
+from typing import Callable, List, Optional
+
+TestsDir = Path(__file__).parent
+sys.path.insert(0, str(TestsDir / 'mocks'))
+sys.path.insert(1, str(TestsDir.parent))
+
+import pytest
+import commands2
+from lib.deferred import DeferredScheduler
+from lib.tunables import Tunables
+from wpilib import DriverStation, TimedRobot
+from wpilib.simulation import DriverStationSim, isTimingPaused, pauseTiming, resumeTiming, stepTiming
+
+# Reading an unplugged joystick prints a warning, which would end up in the measurements
+DriverStation.silenceJoystickConnectionWarning(True)
+
+BaselinesPath = TestsDir / 'benchmarks.json'
+DefaultThreshold = 2.0
+# Extra samples taken before a hot path is reported as regressed
+HotPathRetries = 3
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup('hotpath', 'hot path benchmarks')
+    group.addoption(
+        '--hotpath-update', action='store_true', default=False,
+        help=f'Record new baselines in {BaselinesPath.name} instead of comparing against them')
+    group.addoption(
+        '--hotpath-threshold', type=float,
+        default=float(os.environ.get('HOTPATH_THRESHOLD', DefaultThreshold)),
+        help='Fail when a hot path is slower than baseline * threshold (default: %(default)s)')
+
+
+def _calibrate() -> float:
+    """Times a fixed pure-Python workload so baselines can be stored relative to the
+    speed of the machine running the suite (a laptop is not a roboRIO)"""
+    def workload():
+        total = 0.0
+        for i in range(1000):
+            total += i * 0.5
+        return total
+    for _ in range(5):
+        _timeCall(workload, number=100)
+    return median(_timeCall(workload, number=100) for _ in range(25))
+
+
+def _timeCall(fn: Callable[[], object], number: int) -> float:
+    """Returns the average time in seconds of a single call to fn over number calls"""
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number
+
+
+class HotPathResults:
+    def __init__(self, config: pytest.Config) -> None:
+        self.update: bool = config.getoption('--hotpath-update')
+        self.threshold: float = config.getoption('--hotpath-threshold')
+        self.baselines: dict = json.loads(BaselinesPath.read_text()) if BaselinesPath.exists() else {}
+        self.results: dict = {}
+        self._calibration: Optional[float] = None
+
+    @property
+    def calibration(self) -> float:
+        if self._calibration is None:
+            self._calibration = _calibrate()
+        return self._calibration
+
+    def save(self) -> None:
+        self.baselines.update(self.results)
+        BaselinesPath.write_text(json.dumps(dict(sorted(self.baselines.items())), indent=2) + '\n')
+
+
+HotPathResultsKey = pytest.StashKey[HotPathResults]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[HotPathResultsKey] = HotPathResults(config)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    results = session.config.stash[HotPathResultsKey]
+    if results.update and results.results:
+        results.save()
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    results = config.stash[HotPathResultsKey]
+    if not results.results:
+        return
+    terminalreporter.section('hot paths')
+    for name, result in sorted(results.results.items()):
+        baseline = results.baselines.get(name)
+        if results.update:
+            change = 'recorded'
+        elif baseline:
+            change = f'{result["relative"] / baseline["relative"]:.2f}x baseline'
+        else:
+            change = 'no baseline'
+        terminalreporter.write_line(f'{name:<50} {result["median_us"]:>10.2f} us  {change}')
+
+
+@pytest.fixture
+def hotpath(request: pytest.FixtureRequest):
+    """Times a callable pytest-benchmark style and fails the test if it regressed.
+
+    Usage: ``hotpath(fn)`` or ``hotpath(fn, setup=reset)``. When setup is given it runs
+    before every call and is excluded from the measurement.
+    """
+    results: HotPathResults = request.config.stash[HotPathResultsKey]
+    name = request.node.name
+
+    def sample(fn, setup, rounds, targetTime) -> List[float]:
+        gcEnabled = gc.isenabled()
+        gc.disable()
+        try:
+            if setup is None:
+                # Warm up caches, then size the rounds so each one takes about targetTime
+                _timeCall(fn, 10)
+                number = max(1, int(targetTime / max(_timeCall(fn, 10), 1e-9)))
+                return [_timeCall(fn, number) for _ in range(rounds)]
+            setup()
+            fn()
+            times = []
+            for _ in range(rounds * 3):
+                setup()
+                start = time.perf_counter()
+                fn()
+                times.append(time.perf_counter() - start)
+            return times
+        finally:
+            if gcEnabled:
+                gc.enable()
+
+    def measure(
+            fn: Callable[[], object],
+            setup: Optional[Callable[[], object]] = None,
+            rounds: int = 20,
+            targetTime: float = 0.02) -> None:
+        # Medians are compared rather than minimums: a single lucky round can make the
+        # minimum of a baseline unreachably fast
+        times = sample(fn, setup, rounds, targetTime)
+        baseline = results.baselines.get(name)
+        for _ in range(HotPathRetries):
+            if baseline is None or results.update \
+                    or median(times) / results.calibration / baseline['relative'] <= results.threshold:
+                break
+            # Sample again before failing, in case something else was using the CPU
+            times = min(times, sample(fn, setup, rounds, targetTime), key=median)
+
+        result = {
+            'min_us': min(times) * 1e6,
+            'median_us': median(times) * 1e6,
+            'relative': median(times) / results.calibration
+        }
+        results.results[name] = result
+
+        if results.update or baseline is None:
+            return
+        ratio = result['relative'] / baseline['relative']
+        if ratio > results.threshold:
+            pytest.fail(
+                f'{name} regressed: {ratio:.2f}x baseline '
+                f'({result["median_us"]:.2f} us, threshold {results.threshold:.2f}x)')
+
+    return measure
+
+
+@pytest.fixture
+def scheduler(tmp_path: Path):
+    """A fresh command scheduler, with the simulated robot enabled in teleop"""
+    commands2.CommandScheduler.resetInstance()
+    DeferredScheduler.resetInstance()
+    Tunables.resetInstance()
+    Tunables._instance = Tunables(tmp_path / 'tunables.json')
+    DriverStationSim.setAutonomous(False)
+    DriverStationSim.setTest(False)
+    DriverStationSim.setEnabled(True)
+    DriverStationSim.notifyNewData()
+    yield commands2.CommandScheduler.getInstance()
+    DriverStationSim.setEnabled(False)
+    DriverStationSim.notifyNewData()
+    commands2.CommandScheduler.resetInstance()
+    DeferredScheduler.resetInstance()
+    Tunables.resetInstance()
+
+
+@pytest.fixture
+def pausedTiming():
+    """Freezes the simulated FPGA clock so timer based commands are deterministic"""
+    pauseTiming()
+    yield
+    resumeTiming()
+
+
+@pytest.fixture
+def runRobot():
+    """Runs a TimedRobot's main loop on a thread.
+
+    Usage: ``step = runRobot(robot)``, then ``step(seconds)`` lets the robot run for that
+    long. With the pausedTiming fixture, stepping advances the simulated clock and waits for
+    every callback that came due (create the robot inside the test, after timing was paused);
+    otherwise the robot runs in real time.
+    """
+    robots = []
+
+    def step(seconds: float) -> None:
+        if not isTimingPaused():
+            time.sleep(seconds)
+            return
+        # Small steps, so callbacks held up by a callback that overran still come due
+        # before the next step
+        for _ in range(round(seconds / 0.001)):
+            stepTiming(0.001)
+        # Stepping waits for the callbacks due before the step, not after it
+        stepTiming(0)
+
+    def start(robot: TimedRobot) -> Callable[[float], None]:
+        thread = threading.Thread(target=robot.startCompetition, daemon=True)
+        thread.start()
+        robots.append((robot, thread))
+        return step
+
+    yield start
+    for robot, thread in robots:
+        robot.endCompetition()
+        thread.join(1)
+
+
+@pytest.fixture
+def container(scheduler):
+    from robotcontainer import RobotContainer
+    return RobotContainer()
@@ -0,0 +1,209 @@
+"""
+Off-robot stand-in for the REVLib ``rev`` module.
+
+Only the surface used by this project is provided. Motor controllers keep their
+state in plain attributes so benchmarks measure our code, not CAN traffic or
+vendor simulation overhead.
+"""
+from enum import Enum, IntEnum
+from wpilib.interfaces import MotorController
+
+
+class REVLibError(IntEnum):
+    kOk = 0
+    kError = 1
+    kTimeout = 2
+    kCANDisconnected = 17
+
+
+class Faults:
+    def __init__(self, rawBits: int = 0) -> None:
+        self.rawBits = rawBits
+
+    def _bit(self, bit: int) -> bool:
+        return bool(self.rawBits & (1 << bit))
+
+    other = property(lambda self: self._bit(0))
+    motorType = property(lambda self: self._bit(1))
+    sensor = property(lambda self: self._bit(2))
+    can = property(lambda self: self._bit(3))
+    temperature = property(lambda self: self._bit(4))
+    gateDriver = property(lambda self: self._bit(5))
+    escEeprom = property(lambda self: self._bit(6))
+    firmware = property(lambda self: self._bit(7))
+
+
+class SparkLowLevel:
+    class MotorType(Enum):
+        kBrushed = 0
+        kBrushless = 1
+
+
+class _EncoderConfig:
+    def __init__(self) -> None:
+        self.positionFactor = 1.0
+        self.velocityFactor = 1.0
+
+    def positionConversionFactor(self, factor: float) -> "_EncoderConfig":
+        self.positionFactor = factor
+        return self
+
+    def velocityConversionFactor(self, factor: float) -> "_EncoderConfig":
+        self.velocityFactor = factor
+        return self
+
+
+class SparkBaseConfig:
+    class IdleMode(Enum):
+        kCoast = 0
+        kBrake = 1
+
+    def __init__(self) -> None:
+        self.encoder = _EncoderConfig()
+        self.values = {}
+
+    def _set(self, key: str, value) -> "SparkBaseConfig":
+        self.values[key] = value
+        return self
+
+    def setIdleMode(self, idleMode: "SparkBaseConfig.IdleMode") -> "SparkBaseConfig":
+        return self._set('idleMode', idleMode)
+
+    def smartCurrentLimit(self, limit: int) -> "SparkBaseConfig":
+        return self._set('smartCurrentLimit', limit)
+
+    def secondaryCurrentLimit(self, limit: float) -> "SparkBaseConfig":
+        return self._set('secondaryCurrentLimit', limit)
+
+    def inverted(self, inverted: bool) -> "SparkBaseConfig":
+        return self._set('inverted', inverted)
+
+    def voltageCompensation(self, voltage: float) -> "SparkBaseConfig":
+        return self._set('voltageCompensation', voltage)
+
+
+class SparkMaxConfig(SparkBaseConfig):
+    pass
+
+
+class SparkFlexConfig(SparkBaseConfig):
+    pass
+
+
+class RelativeEncoder:
+    def __init__(self) -> None:
+        self.position = 0.0
+        self.velocity = 0.0
+
+    def getPosition(self) -> float:
+        return self.position
+
+    def getVelocity(self) -> float:
+        return self.velocity
+
+    def setPosition(self, position: float) -> REVLibError:
+        self.position = position
+        return REVLibError.kOk
+
+
+class SparkBase(MotorController):
+    MotorType = SparkLowLevel.MotorType
+    IdleMode = SparkBaseConfig.IdleMode
+    Faults = Faults
+
+    class ResetMode(Enum):
+        kNoResetSafeParameters = 0
+        kResetSafeParameters = 1
+
+    class PersistMode(Enum):
+        kNoPersistParameters = 0
+        kPersistParameters = 1
+
+    def __init__(self, deviceId: int, motorType: SparkLowLevel.MotorType) -> None:
+        super().__init__()
+        self._deviceId = deviceId
+        self._motorType = motorType
+        self._encoder = RelativeEncoder()
+        self._config = {}
+        self._setpoint = 0.0
+        self._inverted = False
+        self.busVoltage = 12.0
+        self.outputCurrent = 0.0
+        self.motorTemperature = 25.0
+        self.lastError = REVLibError.kOk
+        self.faults = Faults()
+        self.stickyFaults = Faults()
+
+    def configure(self, config: SparkBaseConfig, resetMode, persistMode) -> REVLibError:
+        self._config.update(config.values)
+        self._inverted = self._config.get('inverted', self._inverted)
+        return REVLibError.kOk
+
+    def configureAsync(self, config: SparkBaseConfig, resetMode, persistMode) -> REVLibError:
+        return self.configure(config, resetMode, persistMode)
+
+    def setCANTimeout(self, milliseconds: int) -> REVLibError:
+        return REVLibError.kOk
+
+    def getDeviceId(self) -> int:
+        return self._deviceId
+
+    def getMotorType(self) -> SparkLowLevel.MotorType:
+        return self._motorType
+
+    def getEncoder(self) -> RelativeEncoder:
+        return self._encoder
+
+    def set(self, speed: float) -> None:
+        self._setpoint = speed
+
+    def get(self) -> float:
+        return self._setpoint
+
+    def setVoltage(self, output) -> None:
+        self._setpoint = float(output) / self.busVoltage
+
+    def setInverted(self, isInverted: bool) -> None:
+        self._inverted = isInverted
+
+    def getInverted(self) -> bool:
+        return self._inverted
+
+    def disable(self) -> None:
+        self._setpoint = 0.0
+
+    def stopMotor(self) -> None:
+        self._setpoint = 0.0
+
+    def getAppliedOutput(self) -> float:
+        return self._setpoint
+
+    def getBusVoltage(self) -> float:
+        return self.busVoltage
+
+    def getOutputCurrent(self) -> float:
+        return self.outputCurrent
+
+    def getMotorTemperature(self) -> float:
+        return self.motorTemperature
+
+    def getLastError(self) -> REVLibError:
+        return self.lastError
+
+    def getFaults(self) -> Faults:
+        return self.faults
+
+    def getStickyFaults(self) -> Faults:
+        return self.stickyFaults
+
+    def clearFaults(self) -> REVLibError:
+        self.stickyFaults = Faults()
+        return REVLibError.kOk
+
+
+class SparkMax(SparkBase):
+    pass
+
+
+class SparkFlex(SparkBase):
+    pass
@@ -0,0 +1,88 @@
+import pytest
+from commands2 import Subsystem
+from wpilib.simulation import stepTiming
+
+from lib.coroutine_command import CoroutineCommand, nextCycle, repeat, runCommand, wait, waitUntil
+
+
+@pytest.fixture
+def subsystem(scheduler):
+    return Subsystem()
+
+
+def test_steps_once_per_cycle(scheduler, subsystem):
+    steps = []
+
+    async def routine():
+        steps.append(1)
+        await nextCycle()
+        steps.append(2)
+
+    command = CoroutineCommand(routine, subsystem)
+    scheduler.schedule(command)
+    scheduler.run()
+    assert steps == [1]
+    scheduler.run()
+    assert steps == [1, 2]
+    assert not scheduler.isScheduled(command)
+
+
+def test_wait_and_repeat_use_robot_time(scheduler, subsystem, pausedTiming):
+    calls = []
+
+    async def routine():
+        await repeat(lambda: calls.append('repeat'), 0.05)
+        await wait(0.05)
+        await waitUntil(lambda: False, timeout=0.05)
+
+    command = CoroutineCommand(routine, subsystem)
+    scheduler.schedule(command)
+    for _ in range(20):
+        scheduler.run()
+        stepTiming(0.02)
+
+    assert calls == ['repeat'] * 4
+    assert not scheduler.isScheduled(command)
+
+
+def test_interrupt_closes_coroutine(scheduler, subsystem):
+    cleanedUp = []
+
+    async def routine():
+        try:
+            while True:
+                await nextCycle()
+        finally:
+            cleanedUp.append(True)
+
+    scheduler.schedule(CoroutineCommand(routine, subsystem))
+    scheduler.run()
+    scheduler.schedule(subsystem.runOnce(lambda: None))
+    assert cleanedUp == [True]
+
+
+def test_run_command_checks_requirements(scheduler, subsystem):
+    other = Subsystem()
+
+    async def routine():
+        await runCommand(subsystem.runOnce(lambda: None))
+        await runCommand(other.runOnce(lambda: None))
+
+    scheduler.schedule(CoroutineCommand(routine, subsystem))
+    with pytest.raises(ValueError):
+        scheduler.run()
+
+
+def test_run_command_checks_requirements_after_nested_coroutine(scheduler, subsystem):
+    other = Subsystem()
+
+    async def inner():
+        pass
+
+    async def routine():
+        await runCommand(CoroutineCommand(inner, subsystem))
+        await runCommand(other.runOnce(lambda: None))
+
+    scheduler.schedule(CoroutineCommand(routine, subsystem))
+    with pytest.raises(ValueError):
+        scheduler.run()
@@ -0,0 +1,110 @@
+import commands2
+import gc
+from wpilib import RobotController
+from wpilib.simulation import stepTimingAsync
+
+from lib.deferred import DeferredScheduler
+from lib.enums import TaskPriority
+from robot import Robot
+
+
+def test_runs_by_priority_when_time_allows(pausedTiming):
+    deferred = DeferredScheduler()
+    ran = []
+    deferred.schedule(lambda: ran.append('low'), TaskPriority.Low)
+    deferred.schedule(lambda: ran.append('high'), TaskPriority.High)
+    deferred.schedule(lambda: ran.append('normal'))
+
+    deferred.run(RobotController.getFPGATime() + 1000)
+
+    assert ran == ['high', 'normal', 'low']
+    assert deferred.getPostponed() == 0
+
+
+def test_postpones_work_past_the_deadline(pausedTiming):
+    deferred = DeferredScheduler()
+    ran = []
+    task = deferred.schedule(lambda: ran.append('once'))
+
+    deferred.run(RobotController.getFPGATime() - 1)
+    assert ran == []
+    assert task.postponed == 1
+    # The telemetry task is also carried over
+    assert deferred.getPostponed() == 2
+
+    deferred.run(RobotController.getFPGATime() + 1000)
+    assert ran == ['once']
+    assert deferred.getPostponed() == 0
+
+
+def test_postponed_periodic_tasks_are_not_duplicated(pausedTiming):
+    deferred = DeferredScheduler()
+    ran = []
+    deferred.addPeriodic(lambda: ran.append('periodic'))
+
+    for _ in range(3):
+        deferred.run(RobotController.getFPGATime() - 1)
+    deferred.run(RobotController.getFPGATime() + 1000)
+
+    assert ran == ['periodic']
+
+
+class OverrunRobot(Robot):
+    """The real robot loop without the robot container, whose main loop takes overrun
+    seconds the next time it runs"""
+    overrun: float = 0.0
+
+    def robotInit(self) -> None:
+        pass
+
+    def robotPeriodic(self) -> None:
+        super().robotPeriodic()
+        if self.overrun:
+            stepTimingAsync(self.overrun)
+            self.overrun = 0.0
+
+
+def test_deadline_is_measured_from_cycle_start(pausedTiming, runRobot):
+    DeferredScheduler.resetInstance()
+    robot = OverrunRobot()
+    try:
+        step = runRobot(robot)
+        # Stop 5ms before a main loop, after the last cycle's deferred work has run
+        step(0.115)
+        ran = []
+        task = DeferredScheduler.getInstance().schedule(lambda: ran.append('task'))
+
+        # Deferred work runs late, at +15ms, which is already past its +14ms deadline
+        robot.overrun = 0.015
+        step(0.01)
+        assert ran == []
+        assert task.postponed == 1
+
+        step(0.02)
+        assert ran == ['task']
+    finally:
+        gc.callbacks.remove(robot._memory._onCollection)
+        DeferredScheduler.resetInstance()
+
+
+def test_runs_periodic_tasks_with_real_timing(scheduler, runRobot):
+    # As on the robot, the command scheduler is created while the robot is constructed
+    commands2.CommandScheduler.resetInstance()
+    robot = Robot()
+    ran = []
+    deferred = DeferredScheduler.getInstance()
+    deferred.addPeriodic(lambda: ran.append(True))
+    try:
+        step = runRobot(robot)
+        step(1.0)
+        robot.endCompetition()
+        # Allow for the odd cycle delayed by the machine running the tests, but most
+        # cycles have time for all of the deferred work
+        assert deferred._cycles >= 25
+        assert len(ran) > 0.75 * deferred._cycles
+        assert deferred._postponedCycles < 0.25 * deferred._cycles
+    finally:
+        robot.endCompetition()
+        gc.callbacks.remove(robot._memory._onCollection)
+        gc.unfreeze()
+        gc.enable()
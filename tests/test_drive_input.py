@@ -0,0 +1,68 @@
+import pytest
+from commands2.button import CommandXboxController
+from wpilib.simulation import DriverStationSim, XboxControllerSim
+
+from lib.drive_input import DriveInput
+from lib.enums import SpeedMode
+import constants
+
+Constants = constants.Controllers.DriveInput
+
+
+@pytest.fixture
+def controller():
+    controller = CommandXboxController(constants.Controllers.DriverPort)
+    yield XboxControllerSim(controller.getHID())
+    XboxControllerSim(controller.getHID()).setLeftY(0)
+
+
+def _settle(driveInput: DriveInput, cycles: int = 100):
+    for _ in range(cycles):
+        speeds = driveInput.getChassisSpeeds()
+    return speeds
+
+
+def test_deadband_ignores_small_inputs(controller):
+    driveInput = DriveInput(CommandXboxController(constants.Controllers.DriverPort))
+    controller.setLeftY(Constants.Deadband / 2)
+    controller.notifyNewData()
+    assert _settle(driveInput).vx == 0
+
+
+def test_full_stick_reaches_mode_max_output(controller):
+    driveInput = DriveInput(CommandXboxController(constants.Controllers.DriverPort))
+    controller.setLeftY(-1.0)
+    controller.notifyNewData()
+    for speedMode in SpeedMode:
+        driveInput.setSpeedMode(speedMode)
+        assert _settle(driveInput).vx == pytest.approx(Constants.SpeedModes[speedMode].maxOutput[0])
+
+
+def test_output_is_rate_limited(controller):
+    driveInput = DriveInput(CommandXboxController(constants.Controllers.DriverPort), period=0.02)
+    driveInput.setSpeedMode(SpeedMode.Competition)
+    controller.setLeftY(-1.0)
+    controller.notifyNewData()
+    step = Constants.SpeedModes[SpeedMode.Competition].rateLimit[0] * 0.02
+    assert driveInput.getChassisSpeeds().vx == pytest.approx(step)
+    assert driveInput.getChassisSpeeds().vx == pytest.approx(2 * step)
+
+
+def test_reenabling_does_not_resume_previous_speeds(controller, container, scheduler):
+    controller.setLeftY(-1.0)
+    controller.notifyNewData()
+    for _ in range(100):
+        scheduler.run()
+    assert container._driveInput.getChassisSpeeds().vx > 0
+
+    DriverStationSim.setEnabled(False)
+    DriverStationSim.notifyNewData()
+    scheduler.run()
+    controller.setLeftY(0)
+    controller.notifyNewData()
+    DriverStationSim.setEnabled(True)
+    DriverStationSim.notifyNewData()
+    scheduler.run()
+
+    assert scheduler.isScheduled(container._drive.getDefaultCommand())
+    assert container._driveInput.getChassisSpeeds().vx == 0
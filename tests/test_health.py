@@ -0,0 +1,54 @@
+import pytest
+from wpilib.simulation import stepTiming
+
+from lib.enums import ModuleLocation
+import constants
+
+Constants = constants.Subsystems.Health
+
+
+@pytest.fixture
+def health(container, pausedTiming):
+    return container._health
+
+
+def _module(container, location: ModuleLocation):
+    return next(m for m in container._drive.getModules() if m.getLocation() == location)
+
+
+def _pollAll(health, cycles: int = 10) -> None:
+    for _ in range(cycles):
+        health.periodic()
+        stepTiming(0.02)
+
+
+def test_polls_one_device_per_cycle(health):
+    polled = []
+    for device in health._devices:
+        device.motor.getFaults = lambda device=device: polled.append(device.name) or device.motor.faults
+    _pollAll(health, cycles=len(health._devices))
+    assert polled == [device.name for device in health._devices]
+
+
+def test_unresponsive_module_is_degraded_and_replaced_in_odometry(container, health):
+    leftFront = _module(container, ModuleLocation.LeftFront)
+    leftRear = _module(container, ModuleLocation.LeftRear)
+    leftFront.getMotorController().faults.rawBits = 1 << 3
+    leftRear.getMotorController().getEncoder().position = 2.0
+
+    _pollAll(health, cycles=int(Constants.StaleTimeout / 0.02) + 10)
+    assert leftFront.isDegraded()
+    assert health.getSummary().degraded == 1
+    assert container._drive.getWheelPositions().frontLeft == 2.0
+
+    leftFront.getMotorController().faults.rawBits = 0
+    _pollAll(health)
+    assert not leftFront.isDegraded()
+    assert health.getSummary().degraded == 0
+    assert container._drive.getWheelPositions().frontLeft == 0.0
+
+
+def test_sticky_faults_are_summarized(container, health):
+    container._roller.getMotorController().stickyFaults.rawBits = 1 << 4
+    _pollAll(health)
+    assert health.getSummary().faulted == 1
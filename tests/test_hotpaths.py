@@ -0,0 +1,160 @@
+"""
+Microbenchmarks for code that runs every 20ms robot cycle.
+
+Run with ``python -m pytest tests`` - a test fails when its hot path is slower than
+the recorded baseline by more than ``--hotpath-threshold``. After an intentional
+change, re-record with ``python -m pytest tests --hotpath-update``.
+"""
+import commands2
+from commands2 import cmd
+from wpilib import RobotController
+from wpimath.geometry import Pose2d, Rotation2d, Translation2d
+from wpimath.kinematics import ChassisSpeeds
+from wpimath.trajectory import TrajectoryConfig, TrajectoryGenerator
+from wpimath.controller import HolonomicDriveController, PIDController, ProfiledPIDControllerRadians
+from wpimath.trajectory import TrapezoidProfileRadians
+
+from lib.deferred import DeferredScheduler
+from lib.enums import ControllerRumbleMode, ControllerRumblePattern
+from lib.differential_module import DifferentialControllerCommand
+from lib.tunables import Tunables
+from robotcontainer import RobotContainer
+import constants
+
+DriveConstants = constants.Subsystems.Drive
+
+
+def test_drive_periodic(container, hotpath):
+    hotpath(container._drive.periodic)
+
+
+def test_drive_set_chassis_speed(container, hotpath):
+    drive = container._drive
+    speeds = ChassisSpeeds(0.5, 0.25, 0.1)
+    hotpath(lambda: drive.setChassisSpeed(speeds))
+
+
+def test_drive_get_wheel_positions(container, hotpath):
+    hotpath(container._drive.getWheelPositions)
+
+
+def test_differential_controller_command_execute(container, pausedTiming, hotpath):
+    drive = container._drive
+    trajectory = TrajectoryGenerator.generateTrajectory(
+        Pose2d(0, 0, Rotation2d()),
+        [Translation2d(1, 1), Translation2d(2, -1)],
+        Pose2d(3, 0, Rotation2d()),
+        TrajectoryConfig(DriveConstants.MaxVelocity, DriveConstants.MaxAcceleration)
+    )
+    controller = HolonomicDriveController(
+        PIDController(*DriveConstants.TranslationPID),
+        PIDController(*DriveConstants.TranslationPID),
+        ProfiledPIDControllerRadians(
+            *DriveConstants.RotationPID,
+            TrapezoidProfileRadians.Constraints(DriveConstants.MaxVelocity, DriveConstants.MaxAcceleration)
+        )
+    )
+    command = DifferentialControllerCommand(
+        trajectory=trajectory,
+        pose=drive.getPose,
+        kinematics=DriveConstants.Kinematics,
+        controller=controller,
+        outputModuleStates=drive.setWheelSpeeds,
+        requirements=(drive,)
+    )
+    command.initialize()
+    hotpath(command.execute)
+
+
+def test_robot_container_construction(scheduler, tmp_path, hotpath):
+    def reset():
+        # Every construction registers subsystems, deferred tasks and tunables, so start
+        # each one from the same empty singletons
+        commands2.CommandScheduler.resetInstance()
+        DeferredScheduler.resetInstance()
+        Tunables.resetInstance()
+        Tunables._instance = Tunables(tmp_path / 'tunables.json')
+
+    hotpath(RobotContainer, setup=reset)
+
+
+def test_scheduler_run_teleop(container, scheduler, hotpath):
+    scheduler.run()
+    assert scheduler.isScheduled(container._drive.getDefaultCommand())
+    hotpath(scheduler.run)
+
+
+def test_scheduler_run_autonomous(container, scheduler, pausedTiming, hotpath):
+    command = container.auto.auto_center()
+    scheduler.schedule(command)
+    scheduler.run()
+    assert scheduler.isScheduled(command)
+    hotpath(scheduler.run)
+
+
+def test_deferred_scheduler_run(container, hotpath):
+    deferred = DeferredScheduler.getInstance()
+    hotpath(lambda: deferred.run(RobotController.getFPGATime() + 1000))
+
+
+def _composedAutoCenter(container) -> commands2.Command:
+    """The command tree Auto.auto_center was built from before it became a coroutine"""
+    drive = container._drive
+    roller = container._roller
+    speeds = ChassisSpeeds(vx=0.25)
+    return cmd.sequence(
+        drive.driveCommand(lambda: speeds).withTimeout(3.25),
+        drive.stopCommand().withTimeout(0.1),
+        roller.ejectCommand().withTimeout(0.5)
+    )
+
+
+def test_composed_auto_construction(container, hotpath):
+    hotpath(lambda: _composedAutoCenter(container))
+
+
+def test_coroutine_auto_construction(container, hotpath):
+    hotpath(container.auto.auto_center)
+
+
+def test_composed_auto_tick(container, scheduler, pausedTiming, hotpath):
+    command = _composedAutoCenter(container)
+    scheduler.schedule(command)
+    scheduler.run()
+    assert scheduler.isScheduled(command)
+    hotpath(scheduler.run)
+
+
+def test_coroutine_auto_tick(container, scheduler, pausedTiming, hotpath):
+    command = container.auto.auto_center()
+    scheduler.schedule(command)
+    scheduler.run()
+    assert scheduler.isScheduled(command)
+    hotpath(scheduler.run)
+
+
+def test_drive_input_get_chassis_speeds(container, hotpath):
+    hotpath(container._driveInput.getChassisSpeeds)
+
+
+def test_rumble_periodic(container, hotpath):
+    rumble = container._rumble
+    rumble.rumble(ControllerRumbleMode.Both, ControllerRumblePattern.Long)
+
+    def periodic():
+        rumble.rumble(ControllerRumbleMode.Driver, ControllerRumblePattern.Short)
+        rumble.periodic()
+
+    try:
+        hotpath(periodic)
+    finally:
+        # Leave the simulated controllers still, even when the benchmark fails
+        rumble.stop()
+
+
+def test_power_periodic(container, hotpath):
+    hotpath(container._power.periodic)
+
+
+def test_health_periodic(container, hotpath):
+    hotpath(container._health.periodic)
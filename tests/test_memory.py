@@ -0,0 +1,129 @@
+import commands2
+import gc
+import pytest
+import wpilib
+from wpilib.simulation import stepTimingAsync
+from wpimath.kinematics import ChassisSpeeds
+
+from lib.enums import RobotMode
+from lib.memory import MemoryManager
+from lib.utils import CycleClock
+from robot import Robot
+import constants
+
+
+@pytest.fixture
+def memory():
+    robot = wpilib.TimedRobot()
+    manager = MemoryManager(
+        robot,
+        CycleClock(robot.getPeriod()),
+        loopEndOffset=constants.Memory.LoopEndOffset,
+        idleOffset=constants.Memory.IdleOffset,
+        minSlack=constants.Memory.MinSlack,
+        generation1Threshold=constants.Memory.Generation1Threshold
+    )
+    yield manager
+    gc.callbacks.remove(manager._onCollection)
+    gc.unfreeze()
+    gc.enable()
+    # Release the robot's notifier, simulated time can't be stepped while it is waiting
+    robot.endCompetition()
+
+
+def test_enabled_modes_disable_automatic_collection(memory):
+    memory.setMode(RobotMode.Teleop)
+    assert not gc.isenabled()
+    memory.setMode(RobotMode.Disabled)
+    assert gc.isenabled()
+
+
+def test_freeze_moves_startup_objects_out_of_collection(memory):
+    memory.freeze()
+    assert gc.get_freeze_count() > 0
+
+
+def test_periodic_collects_and_records_stats(memory):
+    memory.setMode(RobotMode.Auto)
+    for _ in range(100):
+        cycle = []
+        cycle.append(cycle)
+    memory.periodic()
+
+    stats = memory.getStats(RobotMode.Auto)
+    assert stats.cycles == 1
+    assert stats.trackedAllocations >= 100
+    assert stats.allocatedBlocks >= 100
+    assert stats.collections + stats.skippedCollections == 1
+
+
+def test_allocated_blocks_include_untracked_objects(memory):
+    memory.setMode(RobotMode.Auto)
+    speeds = [ChassisSpeeds(vx=i) for i in range(100)]
+    memory.periodic()
+
+    stats = memory.getStats(RobotMode.Auto)
+    assert not gc.is_tracked(speeds[0])
+    assert stats.trackedAllocations < 100
+    assert stats.allocatedBlocks >= 100
+
+
+class OverrunRobot(wpilib.TimedRobot):
+    """Makes the main loop take overrun seconds the next time it runs"""
+    overrun: float = 0.0
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.clock = CycleClock(self.getPeriod())
+
+    def robotPeriodic(self) -> None:
+        self.clock.startCycle(self.getLoopStartTime())
+        if self.overrun:
+            stepTimingAsync(self.overrun)
+            self.overrun = 0.0
+
+
+def test_slack_is_measured_from_cycle_start(pausedTiming, runRobot):
+    robot = OverrunRobot()
+    manager = MemoryManager(
+        robot,
+        robot.clock,
+        loopEndOffset=constants.Memory.LoopEndOffset,
+        idleOffset=constants.Memory.IdleOffset,
+        minSlack=constants.Memory.MinSlack,
+        generation1Threshold=constants.Memory.Generation1Threshold
+    )
+    try:
+        step = runRobot(robot)
+        step(0.1)
+        stats = manager.getStats(RobotMode.Disabled)
+        assert stats.cycles == 4
+        assert stats.slackMin == pytest.approx(robot.getPeriod() - constants.Memory.IdleOffset)
+
+        # The idle callback runs late, straight after the main loop, with less time left
+        robot.overrun = 0.017
+        step(0.03)
+        assert stats.cycles == 6
+        assert stats.slackMin == pytest.approx(robot.getPeriod() - 0.017)
+        assert stats.loopTimeMax == pytest.approx(0.017)
+    finally:
+        gc.callbacks.remove(manager._onCollection)
+
+
+def test_collects_in_idle_time_with_real_timing(scheduler, runRobot):
+    # As on the robot, the command scheduler is created while the robot is constructed
+    commands2.CommandScheduler.resetInstance()
+    robot = Robot()
+    try:
+        step = runRobot(robot)
+        step(1.0)
+        stats = robot._memory.getStats(RobotMode.Teleop)
+        # Allow for the odd cycle delayed by the machine running the tests, but most
+        # cycles have plenty of time left for a collection
+        assert stats.cycles >= 25
+        assert stats.collections > 3 * stats.skippedCollections
+    finally:
+        robot.endCompetition()
+        gc.callbacks.remove(robot._memory._onCollection)
+        gc.unfreeze()
+        gc.enable()
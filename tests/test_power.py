@@ -0,0 +1,74 @@
+import pytest
+from wpilib.simulation import RoboRioSim
+
+from subsystems.power import Power
+import constants
+
+Constants = constants.Subsystems.Power
+
+
+@pytest.fixture
+def power(container):
+    yield container._power
+    RoboRioSim.resetData()
+
+
+def _setCurrent(container, amps: float) -> None:
+    for motor in container._drive.getMotorControllers():
+        motor.outputCurrent = amps
+
+
+def test_full_output_within_budget(container, power):
+    RoboRioSim.setVInVoltage(12.5)
+    _setCurrent(container, Constants.CurrentBudget / 8)
+    power.periodic()
+    assert power.getScale() == 1.0
+
+
+def test_scales_down_when_over_current_budget_and_recovers(container, power):
+    RoboRioSim.setVInVoltage(12.5)
+    _setCurrent(container, Constants.CurrentBudget / 2)
+    power.periodic()
+    assert power.getScale() == pytest.approx(0.5)
+    assert container._drive._drivetrain._m_maxOutput == pytest.approx(0.5)
+
+    _setCurrent(container, 0)
+    power.periodic()
+    assert 0.5 < power.getScale() < 1.0
+    for _ in range(100):
+        power.periodic()
+    assert power.getScale() == 1.0
+    assert power._interventions == 1
+
+
+def test_keeps_scaling_down_while_still_over_budget(container, power):
+    RoboRioSim.setVInVoltage(12.5)
+    _setCurrent(container, Constants.CurrentBudget / 2)
+    power.periodic()
+    assert power.getScale() == pytest.approx(0.5)
+
+    # Still over budget at half output, the scale must not recover
+    _setCurrent(container, 150 / 4)
+    power.periodic()
+    assert power.getScale() == pytest.approx(0.5 * Constants.CurrentBudget / 150)
+
+    _setCurrent(container, Constants.CurrentBudget)
+    for _ in range(10):
+        power.periodic()
+    assert power.getScale() == Constants.MinOutputScale
+
+
+def test_scales_down_when_voltage_sags(container, power):
+    RoboRioSim.setVInVoltage(Constants.BrownoutVoltage)
+    power.periodic()
+    assert power.getScale() == Constants.MinOutputScale
+
+
+def test_recovery_rate_follows_robot_period(container, power):
+    slowPower = Power(container._drive, container._roller, period=0.1)
+    RoboRioSim.setVInVoltage(12.5)
+    _setCurrent(container, Constants.CurrentBudget / 2)
+    slowPower.periodic()
+    _setCurrent(container, 0)
+    slowPower.periodic()
+    assert slowPower.getScale() == pytest.approx(0.5 + Constants.ScaleRecoveryRate * 0.1)
@@ -0,0 +1,52 @@
+import pytest
+from commands2.button import CommandXboxController
+from wpilib.interfaces import GenericHID
+from wpilib.simulation import XboxControllerSim, stepTiming
+
+from lib.enums import ControllerRumbleMode, ControllerRumblePattern
+from subsystems.rumble import Rumble
+import constants
+
+
+@pytest.fixture
+def rumble(scheduler, pausedTiming):
+    rumble = Rumble(
+        CommandXboxController(constants.Controllers.DriverPort),
+        CommandXboxController(constants.Controllers.OperatorPort))
+    yield rumble
+    rumble.stop()
+
+
+def _rumbleOf(port: int) -> float:
+    controller = CommandXboxController(port)
+    return XboxControllerSim(controller.getHID()).getRumble(GenericHID.RumbleType.kLeftRumble)
+
+
+def _step(rumble: Rumble, seconds: float) -> None:
+    stepTiming(seconds)
+    rumble.periodic()
+
+
+def test_plays_pattern_on_selected_controller(rumble):
+    rumble.rumble(ControllerRumbleMode.Operator, ControllerRumblePattern.Short)
+    rumble.periodic()
+    assert _rumbleOf(constants.Controllers.OperatorPort) == pytest.approx(1.0, abs=0.01)
+    assert _rumbleOf(constants.Controllers.DriverPort) == 0
+
+    _step(rumble, 0.2)
+    assert _rumbleOf(constants.Controllers.OperatorPort) == 0
+    _step(rumble, 0.1)
+    assert _rumbleOf(constants.Controllers.OperatorPort) == pytest.approx(1.0, abs=0.01)
+    _step(rumble, 0.2)
+    assert _rumbleOf(constants.Controllers.OperatorPort) == 0
+
+
+def test_overlapping_requests_keep_the_longest(rumble):
+    rumble.rumble(ControllerRumbleMode.Both, ControllerRumblePattern.Long)
+    rumble.periodic()
+    _step(rumble, 0.1)
+    rumble.rumble(ControllerRumbleMode.Driver, ControllerRumblePattern.Short)
+    _step(rumble, 0.15)
+    assert _rumbleOf(constants.Controllers.DriverPort) == pytest.approx(1.0, abs=0.01)
+    _step(rumble, 0.6)
+    assert _rumbleOf(constants.Controllers.DriverPort) == 0
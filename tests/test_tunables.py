@@ -0,0 +1,82 @@
+import json
+from ntcore import NetworkTableInstance
+from wpimath.geometry import Pose2d, Rotation2d
+from wpimath.trajectory import TrajectoryConfig, TrajectoryGenerator
+
+from lib.tunables import Tunables
+import constants
+
+
+def _publish(key: str, value: float) -> None:
+    NetworkTableInstance.getDefault().getTable(constants.Tunables.TableName).getEntry(key).setDouble(value)
+
+
+def test_defaults_are_overlaid_by_saved_values(scheduler, tmp_path):
+    path = tmp_path / 'saved.json'
+    path.write_text(json.dumps({'Test/Saved': 2.0}))
+    tunables = Tunables(path)
+    assert tunables.add('Test/Saved', 1.0).value == 2.0
+    assert tunables.add('Test/Default', 1.0).value == 1.0
+
+
+def test_invalid_saved_values_are_skipped(scheduler, tmp_path):
+    path = tmp_path / 'invalid.json'
+    path.write_text(json.dumps({'Test/Valid': 2.0, 'Test/Null': None, 'Test/Text': 'fast', 'Test/List': [1]}))
+    tunables = Tunables(path)
+    assert tunables.add('Test/Valid', 1.0).value == 2.0
+    assert tunables.add('Test/Null', 1.0).value == 1.0
+    assert tunables.add('Test/Text', 1.0).value == 1.0
+    assert tunables.add('Test/List', 1.0).value == 1.0
+
+    path.write_text(json.dumps([2.0]))
+    assert Tunables(path).add('Test/NotAnObject', 1.0).value == 1.0
+
+
+def test_changes_notify_subscribers_and_are_saved(scheduler, tmp_path):
+    path = tmp_path / 'changed.json'
+    tunables = Tunables(path)
+    tunable = tunables.add('Test/Changed', 1.0)
+    changes = []
+    tunable.subscribe(changes.append)
+
+    _publish('Test/Changed', 3.0)
+    tunables.poll()
+    assert tunable.value == 3.0
+    assert changes == [3.0]
+
+    tunables._save()
+    assert json.loads(path.read_text()) == {'Test/Changed': 3.0}
+
+
+def test_roller_uses_tuned_speed(container):
+    roller = container._roller
+    _publish('Roller/EjectSpeed', 0.5)
+    Tunables.getInstance().poll()
+    roller.eject()
+    assert roller.getMotorController().get() == 0.5
+
+    _publish('Roller/EjectSpeed', constants.Subsystems.Roller.EjectSpeed)
+    Tunables.getInstance().poll()
+
+
+def test_roller_current_limit_is_reconfigured(container):
+    roller = container._roller
+    _publish('Roller/MotorCurrentLimit', 30)
+    Tunables.getInstance().poll()
+    assert roller.getMotorController()._config['smartCurrentLimit'] == 30
+
+    _publish('Roller/MotorCurrentLimit', constants.Subsystems.Roller.MotorCurrentLimit)
+    Tunables.getInstance().poll()
+
+
+def test_trajectory_commands_get_tuned_controller(container):
+    trajectory = TrajectoryGenerator.generateTrajectory(
+        [Pose2d(), Pose2d(1, 0, Rotation2d())], TrajectoryConfig(1, 1))
+    command = container.game.followTrajectoryCommand(container._drive.getPose, trajectory)
+    _publish('Drive/TranslationPID/P', 2.0)
+    Tunables.getInstance().poll()
+    command.initialize()
+    assert command._controller.getXController().getP() == 2.0
+
+    _publish('Drive/TranslationPID/P', constants.Subsystems.Drive.TranslationPID.P)
+    Tunables.getInstance().poll()